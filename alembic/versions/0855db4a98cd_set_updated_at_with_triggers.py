@@ -0,0 +1,45 @@
+"""Set updated_at with triggers.
+
+Revision ID: 0855db4a98cd
+Revises: 45ef3bf2b9d4
+Create Date: 2026-10-16 20:04:18.552019
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0855db4a98cd"
+down_revision: str | Sequence[str] | None = "45ef3bf2b9d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("users", "todos", "todo_items")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER {table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION set_updated_at()")
@@ -0,0 +1,33 @@
+"""Generate ids server side.
+
+Revision ID: 45ef3bf2b9d4
+Revises: 676a62c64a39
+Create Date: 2026-10-16 19:52:40.914377
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "45ef3bf2b9d4"
+down_revision: str | Sequence[str] | None = "676a62c64a39"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("users", "todos", "todo_items")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "id", existing_type=sa.UUID(), server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "id", existing_type=sa.UUID(), server_default=None)
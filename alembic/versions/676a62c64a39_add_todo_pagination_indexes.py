@@ -0,0 +1,29 @@
+"""Add todo pagination indexes.
+
+Revision ID: 676a62c64a39
+Revises: a49a22913272
+Create Date: 2026-10-16 19:45:12.318204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "676a62c64a39"
+down_revision: str | Sequence[str] | None = "a49a22913272"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_todos_user_id_created_at", "todos", ["user_id", "created_at"], unique=False)
+    op.create_index("ix_todo_items_todo_id_created_at", "todo_items", ["todo_id", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_todo_items_todo_id_created_at", table_name="todo_items")
+    op.drop_index("ix_todos_user_id_created_at", table_name="todos")
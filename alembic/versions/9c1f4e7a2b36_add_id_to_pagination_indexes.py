@@ -0,0 +1,35 @@
+"""Add id to pagination indexes.
+
+Revision ID: 9c1f4e7a2b36
+Revises: 0855db4a98cd
+Create Date: 2026-10-16 21:12:07.406118
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1f4e7a2b36"
+down_revision: str | Sequence[str] | None = "0855db4a98cd"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_todos_user_id_created_at_id", "todos", ["user_id", "created_at", "id"], unique=False)
+    op.create_index(
+        "ix_todo_items_todo_id_created_at_id", "todo_items", ["todo_id", "created_at", "id"], unique=False,
+    )
+    op.drop_index("ix_todos_user_id_created_at", table_name="todos")
+    op.drop_index("ix_todo_items_todo_id_created_at", table_name="todo_items")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_todo_items_todo_id_created_at", "todo_items", ["todo_id", "created_at"], unique=False)
+    op.create_index("ix_todos_user_id_created_at", "todos", ["user_id", "created_at"], unique=False)
+    op.drop_index("ix_todo_items_todo_id_created_at_id", table_name="todo_items")
+    op.drop_index("ix_todos_user_id_created_at_id", table_name="todos")
@@ -0,0 +1,58 @@
+"""Generate time ordered ids.
+
+Revision ID: b7d2e5a1c840
+Revises: 9c1f4e7a2b36
+Create Date: 2026-10-16 20:31:07.418262
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e5a1c840"
+down_revision: str | Sequence[str] | None = "9c1f4e7a2b36"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("users", "todos", "todo_items")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # UUIDv7: the first 48 bits of a random UUID are replaced with the Unix time in milliseconds and the
+    # version nibble is set from 4 to 7 (bits 52 and 53), so new ids sort after older ones
+    op.execute(
+        """
+        CREATE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """,
+    )
+    for table in TABLES:
+        op.alter_column(table, "id", existing_type=sa.UUID(), server_default=sa.text("uuid_generate_v7()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "id", existing_type=sa.UUID(), server_default=sa.text("gen_random_uuid()"))
+    op.execute("DROP FUNCTION uuid_generate_v7()")
@@ -0,0 +1,29 @@
+"""Lowercase user emails.
+
+Revision ID: e3a9c6f20d57
+Revises: b7d2e5a1c840
+Create Date: 2026-10-16 20:48:52.106734
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a9c6f20d57"
+down_revision: str | Sequence[str] | None = "b7d2e5a1c840"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Emails are lowercased on signup and login, so existing accounts must be stored the same way to be found.
+    # Fails on the unique constraint if two accounts only differ by case, which has to be resolved by hand.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The original casing is not kept, emails stay lowercased
@@ -8,12 +8,30 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 class DatabaseConnection:
     """Database connection class using SQLAlchemy async engine."""
 
-    def __init__(self, connection_string: str, *, enable_echo: bool = True) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        connection_string: str,
+        *,
+        enable_echo: bool = True,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_recycle: int = 280,
+        pool_pre_ping: bool = False,
+        statement_cache_size: int = 500,
+    ) -> None:
         """Initialize database connection with provided connection string.
 
         Args:
             connection_string: Database connection string (should use postgresql+asyncpg:// for async support)
             enable_echo (bool, optional): Whether to log SQL queries. Defaults to True.
+            pool_size (int, optional): Number of connections kept open in the pool. Defaults to 20.
+            max_overflow (int, optional): Extra connections allowed above pool_size under load. Defaults to 10.
+            pool_recycle (int, optional): Seconds after which a connection is replaced, kept below typical
+                PgBouncer/load balancer idle timeouts. Defaults to 280.
+            pool_pre_ping (bool, optional): Whether to test each connection with a round trip on checkout.
+                Only worth its cost where connections are dropped silently. Defaults to False.
+            statement_cache_size (int, optional): Prepared statements cached per connection by asyncpg. Set to 0
+                behind PgBouncer in transaction mode. Defaults to 500.
 
         """
         self.connection_string = connection_string
@@ -23,6 +41,14 @@ class DatabaseConnection:
             self.connection_string,
             echo=enable_echo,
             future=True,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            # Bulk inserts are batched into multi-row INSERT ... RETURNING statements of up to this many rows,
+            # still capped by the driver's bind parameter limit
+            insertmanyvalues_page_size=10_000,
+            connect_args={"prepared_statement_cache_size": statement_cache_size},
         )
 
         # Create async session factory
@@ -30,6 +56,17 @@ class DatabaseConnection:
             bind=self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
+            # Repositories write through INSERT/UPDATE/DELETE statements rather than session.add, so there
+            # is never pending state to flush before a query
+            autoflush=False,
+        )
+        # Same pool, but statements run outside an explicit transaction. Used for reads and other single
+        # statement operations, which saves the BEGIN and ROLLBACK/COMMIT round trips around them
+        self.autocommit_session = async_sessionmaker(
+            bind=self.engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
         )
 
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
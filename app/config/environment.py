@@ -20,6 +20,12 @@ class Settings(BaseSettings):
     database_password: str = get_env("DATABASE_PASSWORD", "password")
 
     database_logging: bool = get_env_bool("DATABASE_LOGGING", "False")
+    database_pool_size: int = get_env_int("DATABASE_POOL_SIZE", 20)
+    database_max_overflow: int = get_env_int("DATABASE_MAX_OVERFLOW", 10)
+    database_pool_recycle: int = get_env_int("DATABASE_POOL_RECYCLE", 280)
+    database_pool_pre_ping: bool = get_env_bool("DATABASE_POOL_PRE_PING", "False")
+    database_statement_cache_size: int = get_env_int("DATABASE_STATEMENT_CACHE_SIZE", 500)
+    todo_count_cache_ttl: int = get_env_int("TODO_COUNT_CACHE_TTL", 30)
 
     # API settings
     app_name: str = get_env("APP_NAME", "Todo API")
@@ -30,6 +36,8 @@ class Settings(BaseSettings):
     server_port: int = get_env_int("SERVER_PORT", 8000)
     server_reload: bool = get_env_bool("SERVER_RELOAD", "True")
     server_log_level: str = get_env("SERVER_LOG_LEVEL", "info")
+    server_workers: int = get_env_int("SERVER_WORKERS", 1)
+    server_thread_limit: int = get_env_int("SERVER_THREAD_LIMIT", 100)
 
     # JWT settings
     jwt_secret_key: str = get_env("JWT_SECRET_KEY", "your_secret_key")
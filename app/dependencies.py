@@ -51,7 +51,15 @@ def get_database() -> DatabaseConnection:
             database_name=settings.database_name,
         )
 
-    return DatabaseConnection(connection_string, enable_echo=settings.database_logging)
+    return DatabaseConnection(
+        connection_string,
+        enable_echo=settings.database_logging,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        statement_cache_size=settings.database_statement_cache_size,
+    )
 
 
 @lru_cache
@@ -68,7 +76,7 @@ def get_todo_repository(database: DatabaseConnection | None = None) -> TodoRepos
     """
     if database is None:
         database = get_database()
-    return TodoPGRepository(database=database)
+    return TodoPGRepository(database=database, count_cache_ttl=get_env_settings().todo_count_cache_ttl)
 
 
 @lru_cache
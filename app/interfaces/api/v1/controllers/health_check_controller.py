@@ -1,15 +1,19 @@
 """Health check controller for verifying API status."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.dependencies import get_database
 from app.schemas.health_check_schema import HealthCheckResponse
+from app.utils.json_response_util import json_response, json_serializer
 
 #versioning is handled in the main file
 router = APIRouter(prefix="/health", tags=["health"])
 
-@router.get("/", summary="Health check endpoint")
-async def health_check() -> HealthCheckResponse:
+# The healthy response never changes, so it is encoded once at import time
+_HEALTHY = json_serializer(HealthCheckResponse)(HealthCheckResponse(status="ok"))
+
+@router.get("/", summary="Health check endpoint", response_model=HealthCheckResponse)
+async def health_check() -> Response:
     """Perform a health check to verify API status.
 
     Returns:
@@ -25,4 +29,4 @@ async def health_check() -> HealthCheckResponse:
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Database connection failed: {e!s}") from e
 
-    return HealthCheckResponse(status="ok")
+    return json_response(_HEALTHY)
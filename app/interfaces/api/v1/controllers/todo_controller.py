@@ -1,12 +1,13 @@
 """FastAPI Todo API Controller."""
 
+import asyncio
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from app.dependencies import get_todo_service
 from app.exceptions.todo_exception import TodoListItemNotFoundError, TodoListNotFoundError
-from app.middleware.jwt_middleware import JWTBearer
+from app.middleware.jwt_middleware import CurrentUserID, JWTBearer
 from app.models.todo_model import TodoListItemModel, TodoListModel
 from app.schemas.todo_schema import (
     PaginatedTodoListItemResponse,
@@ -26,8 +27,23 @@ from app.schemas.todo_schema import (
     TodoListUpdateRequest,
 )
 from app.services.todo_service import TodoService
+from app.utils.cursor_util import PageCursor, decode_cursor, encode_cursor
+from app.utils.json_request_util import json_body, json_body_openapi
+from app.utils.json_response_util import json_list_serializer, json_page_response, json_response, json_serializer
 
 router = APIRouter(prefix="/todos", tags=["todos"])
+# Pages are read and encoded in memory as a whole, so their size is bounded
+_MAX_PAGE_SIZE = 100
+
+_serialize_todo_list = json_serializer(TodoListResponse)
+_serialize_todo_list_item = json_serializer(TodoListItemResponse)
+_serialize_success = json_serializer(SuccessResponse)
+_serialize_todo_lists = json_list_serializer(TodoListResponse)
+_serialize_todo_list_items = json_list_serializer(TodoListItemResponse)
+_parse_todo_list_create_many = json_body(TodoListCreateManyRequest)
+_parse_todo_list_update_many = json_body(TodoListUpdateManyRequest)
+_parse_todo_list_item_create_many = json_body(TodoListItemCreateManyRequest)
+_parse_todo_list_item_update_many = json_body(TodoListItemUpdateManyRequest)
 
 
 def _convert_todo_to_response(todo: TodoListModel) -> TodoListResponse:
@@ -56,18 +72,55 @@ def _convert_todo_item_to_response(item: TodoListItemModel) -> TodoListItemRespo
     return TodoListItemResponse.model_validate(item)
 
 
-@router.post("/", dependencies=[Depends(JWTBearer())])
+def _parse_cursor(after: str | None, page: int) -> PageCursor | None:
+    """Decode the `after` query parameter of the paginated endpoints.
+
+    Args:
+        after (str | None): The cursor sent by the client, if any
+        page (int): The page number sent by the client, which a cursor replaces
+
+    Returns:
+        PageCursor | None: The decoded cursor, or None when the client did not send one
+
+    Raises:
+        HTTPException: 400 - Invalid cursor, or a cursor sent together with a page other than 1
+
+    """
+    if after is None:
+        return None
+    if page != 1:
+        raise HTTPException(status_code=400, detail="page cannot be combined with after")
+    try:
+        return decode_cursor(after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def _success_response(message: str) -> Response:
+    """Build a pre-serialized SuccessResponse.
+
+    Args:
+        message (str): The success message
+
+    Returns:
+        Response: The JSON response carrying the SuccessResponse body
+
+    """
+    return json_response(_serialize_success(SuccessResponse(message=message)))
+
+
+@router.post("/", response_model=TodoListResponse, dependencies=[Depends(JWTBearer())])
 async def create_todo_list(
     todo: TodoListCreateRequest,
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    request: Annotated[Request, Depends()],
-) -> TodoListResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Create a new todo list.
 
     Args:
         todo_service (TodoService): The todo service dependency
         todo (TodoListCreateRequest): Todo creation data including title and optional description
-        request (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         TodoListResponse: The created todo with assigned ID
@@ -78,64 +131,73 @@ async def create_todo_list(
 
     """
     try:
-        user_id = request.state.user_id
         created_todo = await todo_service.create_todo_list(todo, user_id)
-        return _convert_todo_to_response(created_todo)
+        return json_response(_serialize_todo_list(_convert_todo_to_response(created_todo)))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create todo list: {e!s}") from e
 
 
-@router.get("/", dependencies=[Depends(JWTBearer())])
+@router.get("/", response_model=PaginatedTodoListResponse, dependencies=[Depends(JWTBearer())])
 async def get_todo_lists(
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    request: Annotated[Request, Depends()],
+    user_id: CurrentUserID,
     page: int = 1,
-    size: int = 20,
-) -> PaginatedTodoListResponse:
+    size: Annotated[int, Query(ge=1, le=_MAX_PAGE_SIZE)] = 20,
+    after: str | None = None,
+) -> Response:
     """Retrieve all todo lists with pagination.
 
     Args:
         todo_service (TodoService): The todo service dependency
         page (int, optional): Page number. Defaults to 1.
-        size (int, optional): Page size. Defaults to 20.
-        request (Request): The request object containing user context
+        size (int, optional): Page size, from 1 to 100. Defaults to 20.
+        after (str, optional): The next_cursor of the previous page. When given, the page is read right
+            after that row instead of by page number, which stays fast on deep pages. It cannot be combined
+            with a page other than 1, and the response's current_page is then null. Defaults to None.
+        user_id (str): The ID of the authenticated user
 
     Returns:
         PaginatedTodoListResponse: Paginated list of todos
 
     Raises:
+        HTTPException: 400 - Invalid cursor, or a cursor combined with a page
         HTTPException: 404 - Not Found
 
     """
+    cursor = _parse_cursor(after, page)
     try:
         skip = (page - 1) * size
-        user_id = request.state.user_id
-        todos = await todo_service.get_all_todo_lists_without_items(user_id, skip, size)
-        total = await todo_service.count_todo_lists(user_id)
+        # The page and the count each check out their own connection, so run them concurrently
+        todos, total = await asyncio.gather(
+            todo_service.get_all_todo_lists_without_items(user_id, skip, size, cursor),
+            todo_service.count_todo_lists(user_id),
+        )
         total = total if total is not None else (skip + len(todos))
         total_pages = (total + size - 1) // size if size > 0 else 1
-        return PaginatedTodoListResponse(
-            data=[_convert_todo_to_response(todo) for todo in todos],
-            size=len(todos),
-            current_page=page,
-            total_pages=total_pages,
+        next_cursor = encode_cursor(todos[-1]["created_at"], todos[-1]["id"]) if todos and len(todos) == size else None
+        return json_page_response(
+            _serialize_todo_lists(todos),
+            len(todos),
+            page if cursor is None else None,
+            total_pages,
+            next_cursor=next_cursor,
         )
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Failed to retrieve todo lists: {e!s}") from e
 
 
-@router.get("/{todo_id}", dependencies=[Depends(JWTBearer())])
+@router.get("/{todo_id}", response_model=TodoListResponse, dependencies=[Depends(JWTBearer())])
 async def get_todo_list_by_id(
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
     todo_id: str,
-    request: Annotated[Request, Depends()],
-) -> TodoListResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Retrieve a specific todo by ID.
 
     Args:
         todo_service (TodoService): The todo service dependency
         todo_id (str): The unique identifier of the todo
-        request (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         TodoListResponse: The requested todo
@@ -146,29 +208,28 @@ async def get_todo_list_by_id(
 
     """
     try:
-        user_id = request.state.user_id
         todo = await todo_service.get_todo_list_by_id(todo_id, user_id)
-        return _convert_todo_to_response(todo)
+        return json_response(_serialize_todo_list(_convert_todo_to_response(todo)))
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo not found") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve todo: {e!s}") from e
 
 
-@router.put("/{todo_id}", dependencies=[Depends(JWTBearer())])
+@router.put("/{todo_id}", response_model=TodoListResponse, dependencies=[Depends(JWTBearer())])
 async def update_todo_list(
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
     todo_id: str,
     todo: TodoListUpdateRequest,
-    request: Annotated[Request, Depends()],
-) -> TodoListResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Update an existing todo.
 
     Args:
         todo_service (TodoService): The todo service dependency
         todo_id (str): The unique identifier of the todo to update
         todo (TodoListUpdateRequest): Updated todo data (title, description, etc.)
-        request (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         TodoListResponse: The updated todo
@@ -179,9 +240,8 @@ async def update_todo_list(
 
     """
     try:
-        user_id = request.state.user_id
         updated_todo = await todo_service.update_todo_list(todo_id, todo, user_id)
-        return _convert_todo_to_response(updated_todo)
+        return json_response(_serialize_todo_list(_convert_todo_to_response(updated_todo)))
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo not found") from e
     except Exception as e:
@@ -192,14 +252,14 @@ async def update_todo_list(
 async def delete_todo_list(
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
     todo_id: str,
-    request: Annotated[Request, Depends()],
+    user_id: CurrentUserID,
 ) -> None:
     """Delete a todo and all its items.
 
     Args:
         todo_service (TodoService): The todo service dependency
         todo_id (str): The unique identifier of the todo to delete
-        request (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         None: HTTP 200 status on successful deletion
@@ -210,7 +270,6 @@ async def delete_todo_list(
 
     """
     try:
-        user_id = request.state.user_id
         await todo_service.delete_todo_list(todo_id, user_id)
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo not found") from e
@@ -218,43 +277,52 @@ async def delete_todo_list(
         raise HTTPException(status_code=500, detail=f"Failed to delete todo: {e!s}") from e
 
 
-@router.get("/{todo_id}/items", dependencies=[Depends(JWTBearer())])
-async def get_todo_list_items(
+@router.get("/{todo_id}/items", response_model=PaginatedTodoListItemResponse, dependencies=[Depends(JWTBearer())])
+async def get_todo_list_items(  # noqa: PLR0913, PLR0917
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    request: Annotated[Request, Depends()],
+    user_id: CurrentUserID,
     todo_id: str,
     page: int = 1,
-    size: int = 20,
-) -> PaginatedTodoListItemResponse:
+    size: Annotated[int, Query(ge=1, le=_MAX_PAGE_SIZE)] = 20,
+    after: str | None = None,
+) -> Response:
     """Retrieve all items from a specific todo with pagination.
 
     Args:
         todo_service (TodoService): The todo service dependency
         todo_id (str): The unique identifier of the todo
         page (int, optional): Page number. Defaults to 1.
-        size (int, optional): Page size. Defaults to 20.
-        request (Request): The request object containing user context
+        size (int, optional): Page size, from 1 to 100. Defaults to 20.
+        after (str, optional): The next_cursor of the previous page. When given, the page is read right
+            after that item instead of by page number, which stays fast on deep pages. It cannot be combined
+            with a page other than 1, and the response's current_page is then null. Defaults to None.
+        user_id (str): The ID of the authenticated user
 
     Returns:
         PaginatedTodoListItemResponse: Paginated list of todo items
 
     Raises:
+        HTTPException: 400 - Invalid cursor, or a cursor combined with a page
         HTTPException: 404 - Todo not found
         HTTPException: 500 - Internal server error
 
     """
+    cursor = _parse_cursor(after, page)
     try:
         skip = (page - 1) * size
-        user_id = request.state.user_id
-        items = await todo_service.get_todo_list_items(todo_id, user_id, skip, size)
-        total = await todo_service.count_todo_list_items(todo_id, user_id)
+        items, total = await asyncio.gather(
+            todo_service.get_todo_list_items(todo_id, user_id, skip, size, cursor),
+            todo_service.count_todo_list_items(todo_id, user_id),
+        )
         total = total if total is not None else (skip + len(items))
         total_pages = (total + size - 1) // size if size > 0 else 1
-        return PaginatedTodoListItemResponse(
-            data=[_convert_todo_item_to_response(item) for item in items],
-            size=len(items),
-            current_page=page,
-            total_pages=total_pages,
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id) if items and len(items) == size else None
+        return json_page_response(
+            _serialize_todo_list_items(items),
+            len(items),
+            page if cursor is None else None,
+            total_pages,
+            next_cursor=next_cursor,
         )
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo not found") from e
@@ -262,20 +330,20 @@ async def get_todo_list_items(
         raise HTTPException(status_code=500, detail=f"Failed to retrieve todo items: {e!s}") from e
 
 
-@router.post("/{todo_id}/items", dependencies=[Depends(JWTBearer())])
+@router.post("/{todo_id}/items", response_model=TodoListItemResponse, dependencies=[Depends(JWTBearer())])
 async def add_todo_list_item(
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
     todo_id: str,
     item: TodoListItemsAddRequest,
-    request: Annotated[Request, Depends()],
-) -> TodoListItemResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Add a new item to a specific todo.
 
     Args:
         todo_service (TodoService): The todo service dependency
         todo_id (str): The unique identifier of the todo
         item (TodoListItemsAddRequest): Item creation data including title and optional completion status
-        request (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         TodoListItemResponse: The created todo item with assigned ID
@@ -287,23 +355,22 @@ async def add_todo_list_item(
 
     """
     try:
-        user_id = request.state.user_id
         created_item = await todo_service.add_todo_list_item(todo_id, item, user_id)
-        return _convert_todo_item_to_response(created_item)
+        return json_response(_serialize_todo_list_item(_convert_todo_item_to_response(created_item)))
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo not found") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to add todo item: {e!s}") from e
 
 
-@router.put("/{todo_id}/items/{item_id}", dependencies=[Depends(JWTBearer())])
+@router.put("/{todo_id}/items/{item_id}", response_model=TodoListItemResponse, dependencies=[Depends(JWTBearer())])
 async def update_todo_list_item(
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
     todo_id: str,
     item_id: str,
     item: TodoListItemUpdateRequest,
-    request: Annotated[Request, Depends()],
-) -> TodoListItemResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Update a specific item within a todo.
 
     Args:
@@ -311,7 +378,7 @@ async def update_todo_list_item(
         todo_id (str): The unique identifier of the todo
         item_id (str): The unique identifier of the item to update
         item (TodoListItemUpdateRequest): Updated item data (title, completion status, etc.)
-        request (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         TodoListItemResponse: The updated todo item
@@ -323,9 +390,8 @@ async def update_todo_list_item(
 
     """
     try:
-        user_id = request.state.user_id
         updated_item = await todo_service.update_todo_item(todo_id, item_id, item, user_id)
-        return _convert_todo_item_to_response(updated_item)
+        return json_response(_serialize_todo_list_item(_convert_todo_item_to_response(updated_item)))
     except TodoListItemNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo or item not found") from e
     except Exception as e:
@@ -337,7 +403,7 @@ async def delete_todo_list_item(
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
     todo_id: str,
     item_id: str,
-    request: Annotated[Request, Depends()],
+    user_id: CurrentUserID,
 ) -> None:
     """Delete a specific item from a todo.
 
@@ -345,7 +411,7 @@ async def delete_todo_list_item(
         todo_service (TodoService): The todo service dependency
         todo_id (str): The unique identifier of the todo
         item_id (str): The unique identifier of the item to delete
-        request (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         None: HTTP 200 status on successful deletion
@@ -356,7 +422,6 @@ async def delete_todo_list_item(
 
     """
     try:
-        user_id = request.state.user_id
         await todo_service.delete_todo_list_item(todo_id, item_id, user_id)
     except TodoListItemNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo or item not found") from e
@@ -364,18 +429,23 @@ async def delete_todo_list_item(
         raise HTTPException(status_code=500, detail=f"Failed to delete todo item: {e!s}") from e
 
 
-@router.post("/batch", dependencies=[Depends(JWTBearer())])
+@router.post(
+    "/batch",
+    response_model=SuccessResponse,
+    dependencies=[Depends(JWTBearer())],
+    openapi_extra=json_body_openapi(TodoListCreateManyRequest),
+)
 async def create_many_todo_lists(
-    request: TodoListCreateManyRequest,
+    request: Annotated[TodoListCreateManyRequest, Depends(_parse_todo_list_create_many)],
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    req: Annotated[Request, Depends()],
-) -> SuccessResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Create multiple todo lists at once.
 
     Args:
         todo_service (TodoService): The todo service dependency
         request (TodoListCreateManyRequest): List of todo lists to create
-        req (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         SuccessResponse: Success message with created count
@@ -386,25 +456,29 @@ async def create_many_todo_lists(
 
     """
     try:
-        user_id = req.state.user_id
         created_todos = await todo_service.create_many_todo_lists(request.todo_lists, user_id)
-        return SuccessResponse(message=f"Successfully created {len(created_todos)} todo lists")
+        return _success_response(f"Successfully created {len(created_todos)} todo lists")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create todo lists: {e!s}") from e
 
 
-@router.put("/batch", dependencies=[Depends(JWTBearer())])
+@router.put(
+    "/batch",
+    response_model=SuccessResponse,
+    dependencies=[Depends(JWTBearer())],
+    openapi_extra=json_body_openapi(TodoListUpdateManyRequest),
+)
 async def update_many_todo_lists(
-    request: TodoListUpdateManyRequest,
+    request: Annotated[TodoListUpdateManyRequest, Depends(_parse_todo_list_update_many)],
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    req: Annotated[Request, Depends()],
-) -> SuccessResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Update multiple todo lists at once.
 
     Args:
         todo_service (TodoService): The todo service dependency
         request (TodoListUpdateManyRequest): List of updates with todo IDs and update data
-        req (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         SuccessResponse: Success message with updated count
@@ -416,27 +490,26 @@ async def update_many_todo_lists(
 
     """
     try:
-        user_id = req.state.user_id
         updated_todos = await todo_service.update_many_todo_lists(request.updates, user_id)
-        return SuccessResponse(message=f"Successfully updated {len(updated_todos)} todo lists")
+        return _success_response(f"Successfully updated {len(updated_todos)} todo lists")
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="One or more todos not found") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update todo lists: {e!s}") from e
 
 
-@router.delete("/batch", status_code=200, dependencies=[Depends(JWTBearer())])
+@router.delete("/batch", response_model=SuccessResponse, status_code=200, dependencies=[Depends(JWTBearer())])
 async def delete_many_todo_lists(
     request: TodoListDeleteManyRequest,
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    req: Annotated[Request, Depends()],
-) -> SuccessResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Delete multiple todo lists at once.
 
     Args:
         todo_service (TodoService): The todo service dependency
         request (TodoListDeleteManyRequest): List of todo IDs to delete
-        req (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         SuccessResponse: Success message with deleted count
@@ -447,29 +520,33 @@ async def delete_many_todo_lists(
 
     """
     try:
-        user_id = req.state.user_id
         await todo_service.delete_many_todo_lists(request.todo_ids, user_id)
-        return SuccessResponse(message=f"Successfully deleted {len(request.todo_ids)} todo lists")
+        return _success_response(f"Successfully deleted {len(request.todo_ids)} todo lists")
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="One or more todos not found") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete todo lists: {e!s}") from e
 
 
-@router.post("/{todo_id}/items/batch", dependencies=[Depends(JWTBearer())])
+@router.post(
+    "/{todo_id}/items/batch",
+    response_model=SuccessResponse,
+    dependencies=[Depends(JWTBearer())],
+    openapi_extra=json_body_openapi(TodoListItemCreateManyRequest),
+)
 async def create_many_todo_list_items(
     todo_id: str,
-    request: TodoListItemCreateManyRequest,
+    request: Annotated[TodoListItemCreateManyRequest, Depends(_parse_todo_list_item_create_many)],
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    req: Annotated[Request, Depends()],
-) -> SuccessResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Add multiple items to a specific todo list.
 
     Args:
         todo_id (str): The unique identifier of the todo list
         todo_service (TodoService): The todo service dependency
         request (TodoListItemCreateManyRequest): List of todo items to add
-        req (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         SuccessResponse: Success message with created count
@@ -481,29 +558,33 @@ async def create_many_todo_list_items(
 
     """
     try:
-        user_id = req.state.user_id
         created_items = await todo_service.create_many_todo_list_items(todo_id, request.items, user_id)
-        return SuccessResponse(message=f"Successfully created {len(created_items)} todo items")
+        return _success_response(f"Successfully created {len(created_items)} todo items")
     except TodoListNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo list not found") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create todo items: {e!s}") from e
 
 
-@router.put("/{todo_id}/items/batch", dependencies=[Depends(JWTBearer())])
+@router.put(
+    "/{todo_id}/items/batch",
+    response_model=SuccessResponse,
+    dependencies=[Depends(JWTBearer())],
+    openapi_extra=json_body_openapi(TodoListItemUpdateManyRequest),
+)
 async def update_many_todo_list_items(
     todo_id: str,
-    request: TodoListItemUpdateManyRequest,
+    request: Annotated[TodoListItemUpdateManyRequest, Depends(_parse_todo_list_item_update_many)],
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    req: Annotated[Request, Depends()],
-) -> SuccessResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Update multiple items in a specific todo list.
 
     Args:
         todo_id (str): The unique identifier of the todo list
         todo_service (TodoService): The todo service dependency
         request (TodoListItemUpdateManyRequest): List of updates with item IDs and update data
-        req (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         SuccessResponse: Success message with updated count
@@ -515,29 +596,33 @@ async def update_many_todo_list_items(
 
     """
     try:
-        user_id = req.state.user_id
         updated_items = await todo_service.update_many_todo_list_items(todo_id, request.updates, user_id)
-        return SuccessResponse(message=f"Successfully updated {len(updated_items)} todo items")
+        return _success_response(f"Successfully updated {len(updated_items)} todo items")
     except TodoListItemNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo list or one or more items not found") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update todo items: {e!s}") from e
 
 
-@router.delete("/{todo_id}/items/batch", status_code=200, dependencies=[Depends(JWTBearer())])
+@router.delete(
+    "/{todo_id}/items/batch",
+    response_model=SuccessResponse,
+    status_code=200,
+    dependencies=[Depends(JWTBearer())],
+)
 async def delete_many_todo_list_items(
     todo_id: str,
     request: TodoListItemDeleteManyRequest,
     todo_service: Annotated[TodoService, Depends(get_todo_service)],
-    req: Annotated[Request, Depends()],
-) -> SuccessResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Delete multiple items from a specific todo list.
 
     Args:
         todo_id (str): The unique identifier of the todo list
         todo_service (TodoService): The todo service dependency
         request (TodoListItemDeleteManyRequest): List of item IDs to delete
-        req (Request): The request object containing user context
+        user_id (str): The ID of the authenticated user
 
     Returns:
         SuccessResponse: Success message with deleted count
@@ -548,9 +633,8 @@ async def delete_many_todo_list_items(
 
     """
     try:
-        user_id = req.state.user_id
         await todo_service.delete_many_todo_list_items(todo_id, request.item_ids, user_id)
-        return SuccessResponse(message=f"Successfully deleted {len(request.item_ids)} todo items")
+        return _success_response(f"Successfully deleted {len(request.item_ids)} todo items")
     except TodoListItemNotFoundError as e:
         raise HTTPException(status_code=404, detail="Todo list or one or more items not found") from e
     except Exception as e:
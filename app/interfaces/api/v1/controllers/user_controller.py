@@ -1,8 +1,9 @@
 """FastAPI User API Controller."""
 
+import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from app.dependencies import get_jwt_service, get_user_service
 from app.exceptions.user_exception import (
@@ -10,14 +11,19 @@ from app.exceptions.user_exception import (
     UserIDNotFoundError,
     WrongEmailOrPasswordError,
 )
-from app.middleware.jwt_middleware import JWTBearer
+from app.middleware.jwt_middleware import CurrentUserID, JWTBearer
 from app.models.user_model import UserModel
 from app.schemas.user_schema import UserCreateRequest, UserLoginRequest, UserResponse, UserResponseWithToken
 from app.services.jwt_service import JWTService
 from app.services.user_service import UserService
+from app.utils.json_response_util import json_response, json_serializer
 from app.utils.logger_util import get_logger
 
 router = APIRouter(prefix="/user", tags=["user"])
+_log = get_logger()
+
+_serialize_user = json_serializer(UserResponse)
+_serialize_user_with_token = json_serializer(UserResponseWithToken)
 
 
 def _convert_user_to_response(user: UserModel) -> UserResponse:
@@ -25,12 +31,12 @@ def _convert_user_to_response(user: UserModel) -> UserResponse:
     return UserResponse.model_validate(user, from_attributes=True)
 
 
-@router.post("/register")
+@router.post("/register", response_model=UserResponseWithToken)
 async def register_user(
     user_data: UserCreateRequest,
     user_service: Annotated[UserService, Depends(get_user_service)],
     jwt_service: Annotated[JWTService, Depends(get_jwt_service)],
-) -> UserResponseWithToken:
+) -> Response:
     """Register a new user and return user data with JWT token.
 
     Args:
@@ -50,20 +56,21 @@ async def register_user(
         user = await user_service.create_user(user_data)
         token = jwt_service.generate_token(user.id)
 
-        return UserResponseWithToken(**_convert_user_to_response(user).model_dump(), token=token)
+        response = UserResponseWithToken(**_convert_user_to_response(user).model_dump(), token=token)
+        return json_response(_serialize_user_with_token(response))
     except UserAlreadyExistsError as e:
         raise HTTPException(status_code=409, detail=str(e)) from e
     except Exception as e:
-        get_logger().error("Error creating user: %s", str(e))
+        _log.error("Error creating user: %s", str(e))
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@router.post("/login")
+@router.post("/login", response_model=UserResponseWithToken)
 async def login_user(
     login_data: UserLoginRequest,
     user_service: Annotated[UserService, Depends(get_user_service)],
     jwt_service: Annotated[JWTService, Depends(get_jwt_service)],
-) -> UserResponseWithToken:
+) -> Response:
     """Login a user and return user data with JWT token.
 
     Args:
@@ -82,23 +89,24 @@ async def login_user(
     try:
         user = await user_service.verify_user_exists(login_data)
         token = jwt_service.generate_token(user.id)
-        return UserResponseWithToken(**_convert_user_to_response(user).model_dump(), token=token)
+        response = UserResponseWithToken(**_convert_user_to_response(user).model_dump(), token=token)
+        return json_response(_serialize_user_with_token(response))
     except WrongEmailOrPasswordError as e:
         raise HTTPException(status_code=401, detail="Wrong email or password") from e
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@router.get("/profile", dependencies=[Depends(JWTBearer())])
+@router.get("/profile", response_model=UserResponse, dependencies=[Depends(JWTBearer())])
 async def get_user_by_id(
     user_service: Annotated[UserService, Depends(get_user_service)],
-    request: Request,
-) -> UserResponse:
+    user_id: CurrentUserID,
+) -> Response:
     """Get user profile by ID from JWT token.
 
     Args:
         user_service (UserService): The user service instance.
-        request (Request): The FastAPI request object containing the JWT token.
+        user_id (str): The ID of the authenticated user.
 
     Returns:
         UserResponse: The user profile data.
@@ -110,10 +118,9 @@ async def get_user_by_id(
 
     """
     try:
-        user_id = request.state.user_id
-        user = await user_service.get_user_by_id(user_id)
+        user = await user_service.get_user_by_id(uuid.UUID(user_id))
 
-        return _convert_user_to_response(user)
+        return json_response(_serialize_user(_convert_user_to_response(user)))
     except UserIDNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
@@ -3,6 +3,10 @@
 This file initializes the FastAPI app, sets up the lifespan context manager,
 and configures the application with custom settings.
 """
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
 
 from app.dependencies import get_env_settings
@@ -10,12 +14,24 @@ from app.interfaces.api.v1.controllers.health_check_controller import router as
 from app.interfaces.api.v1.controllers.todo_controller import router as todo_router
 from app.interfaces.api.v1.controllers.user_controller import router as user_router
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+    """Configure process-wide resources on startup.
+
+    Sync dependencies are run in anyio's worker thread pool, which is capped at 40 threads by default.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = get_env_settings().server_thread_limit
+    yield
+
+
 app = FastAPI(
     title=get_env_settings().app_name,
     description=get_env_settings().app_description,
     version=get_env_settings().app_version,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.include_router(todo_router, prefix="/api/v1")
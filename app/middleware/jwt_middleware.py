@@ -1,7 +1,7 @@
 """JWT middleware for FastAPI to handle Bearer token authentication."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated
 
-from fastapi import HTTPException, Request
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.dependencies import get_jwt_service
@@ -50,3 +50,19 @@ class JWTBearer(HTTPBearer):
             raise HTTPException(status_code=403, detail="Invalid or expired token.") from e
 
         return credentials
+
+
+async def get_current_user_id(request: Request) -> str:
+    """Get the authenticated user's ID set by JWTBearer.
+
+    Args:
+        request (Request): FastAPI request object.
+
+    Returns:
+        str: The ID of the user the Bearer token was issued for.
+
+    """
+    return request.state.user_id
+
+
+CurrentUserID = Annotated[str, Depends(get_current_user_id)]
@@ -4,10 +4,12 @@ This module defines the data models for todos, including todo lists and todo lis
 """
 
 
+from app.models.shared_base_model import Base
 from app.models.todo_model import TodoListItemModel, TodoListModel
-from app.models.user_model import UserModel  # Shared declarative base
+from app.models.user_model import UserModel
 
 __all__ = [
+    "Base",
     "TodoListItemModel",
     "TodoListModel",
     "UserModel",
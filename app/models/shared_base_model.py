@@ -0,0 +1,10 @@
+"""Shared Base Model Module.
+
+Defines the single declarative base every SQLAlchemy model is mapped against.
+"""
+
+from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(DeclarativeBase):
+    """Base class for all models using SQLAlchemy's declarative system."""
@@ -4,24 +4,27 @@ Defines the data models for todos, including todo lists and todo list items.
 """
 
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, FetchedValue, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from app.models.user_model import Base  # shared DeclarativeBase from user_model
+from app.models.shared_base_model import Base
 
 
 class TodoListModel(Base):
     """SQLAlchemy Todo model - represents the todos table."""
 
     __tablename__ = "todos"
+    # Serves "a user's todo lists, newest first" offset and keyset pagination (scanned backwards for DESC)
+    __table_args__ = (Index("ix_todos_user_id_created_at_id", "user_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("uuid_generate_v7()"),
         unique=True,
         nullable=False,
     )
@@ -32,20 +35,22 @@ class TodoListModel(Base):
     )
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[DateTime] = mapped_column(
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
     )
-    updated_at: Mapped[DateTime] = mapped_column(
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at trigger
     )
 
     todo_items = relationship(
         "TodoListItemModel",
         back_populates="todo",
         cascade="all, delete-orphan",
+        # Let the ON DELETE CASCADE foreign key remove items instead of loading them to delete one by one
+        passive_deletes=True,
     )
     user = relationship("UserModel", back_populates="todos")
 
@@ -54,11 +59,13 @@ class TodoListItemModel(Base):
     """SQLAlchemy Todo Item model - represents the todo_items table."""
 
     __tablename__ = "todo_items"
+    # Serves offset and keyset item pagination within a todo list and the ON DELETE CASCADE lookup from todos
+    __table_args__ = (Index("ix_todo_items_todo_id_created_at_id", "todo_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("uuid_generate_v7()"),
         unique=True,
         nullable=False,
     )
@@ -70,14 +77,14 @@ class TodoListItemModel(Base):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    created_at: Mapped[DateTime] = mapped_column(
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
     )
-    updated_at: Mapped[DateTime] = mapped_column(
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at trigger
     )
 
     todo = relationship("TodoListModel", back_populates="todo_items")
@@ -4,15 +4,14 @@ Defines the UserModel for authentication and ownership of todos.
 """
 
 import uuid
+from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, FetchedValue, String, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-
-class Base(DeclarativeBase):
-    """Base class for all models using SQLAlchemy's declarative system."""
+from app.models.shared_base_model import Base
 
 
 class UserModel(Base):
@@ -23,18 +22,18 @@ class UserModel(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("uuid_generate_v7()"),
         unique=True,
         nullable=False,
     )
     email: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
     username: Mapped[str] = mapped_column(String(100), nullable=False)
     password: Mapped[str] = mapped_column(String(200), nullable=False)
-    created_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(),
-    )
-    updated_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(),
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at trigger
     )
 
-    todos = relationship("TodoListModel", back_populates="user")
+    todos = relationship("TodoListModel", back_populates="user", passive_deletes=True)
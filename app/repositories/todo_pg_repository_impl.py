@@ -5,13 +5,21 @@ using SQLAlchemy ORM for database operations with user authorization.
 """
 
 import uuid
-from typing import TypeVar
-
-from sqlalchemy import Select, delete, func, update
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, TypeVar
+
+import asyncpg  # type: ignore[import-untyped]
+from pydantic import BaseModel
+from sqlalchemy import RowMapping, Select, any_, bindparam, delete, false, func, insert, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.dml import ReturningUpdate
 
 from app.config.database import DatabaseConnection
 from app.models.todo_model import TodoListItemModel, TodoListModel
@@ -22,49 +30,286 @@ from app.schemas.todo_schema import (
     TodoListItemUpdateRequest,
     TodoListUpdateRequest,
 )
+from app.utils.cursor_util import PageCursor
 from app.utils.logger_util import get_logger
+from app.utils.ttl_cache_util import TTLCache
+from app.utils.uuid_util import uuid7
 
 T = TypeVar("T")
 
+_log = get_logger()
+
+# Statements are built once at import time with bind parameters, so each call only supplies the values
+# and SQLAlchemy neither rebuilds the statement nor recomputes its compiled cache key
+_IS_OWNED_TODO_LIST = (TodoListModel.id == bindparam("list_id"), TodoListModel.user_id == bindparam("owner_id"))
+_TODO_LIST_ITEMS_JOIN = (TodoListModel, TodoListItemModel.todo_id == TodoListModel.id)
+# ID lists are bound as a single uuid[] and matched with = ANY(...), so the SQL text, and with it the prepared
+# statement and its plan, is the same whatever the number of IDs. An expanding IN renders one per list length
+_TODO_IDS = bindparam("todo_ids", type_=ARRAY(UUID(as_uuid=True)))
+_ITEM_IDS = bindparam("item_ids", type_=ARRAY(UUID(as_uuid=True)))
+
+_SELECT_TODO_LIST = (
+    select(TodoListModel)
+    .options(selectinload(TodoListModel.todo_items), raiseload("*"))
+    .where(*_IS_OWNED_TODO_LIST)
+)
+_SELECT_TODO_LISTS_PAGE = (
+    select(TodoListModel)
+    .options(selectinload(TodoListModel.todo_items), raiseload("*"))
+    .where(TodoListModel.user_id == bindparam("owner_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .order_by(TodoListModel.created_at.desc(), TodoListModel.id.desc())
+)
+# Plain column select, the rows are serialized as is without building ORM objects
+_TODO_LIST_SUMMARIES = (
+    select(
+        TodoListModel.id,
+        TodoListModel.title,
+        TodoListModel.description,
+        TodoListModel.created_at,
+        TodoListModel.updated_at,
+    )
+    .where(TodoListModel.user_id == bindparam("owner_id"))
+    .order_by(TodoListModel.created_at.desc(), TodoListModel.id.desc())
+    .limit(bindparam("limit"))
+)
+_SELECT_TODO_LIST_SUMMARIES_PAGE = _TODO_LIST_SUMMARIES.offset(bindparam("skip"))
+# Keyset page: seeks past the cursor row in the (user_id, created_at, id) index instead of skipping rows
+_SELECT_TODO_LIST_SUMMARIES_AFTER = _TODO_LIST_SUMMARIES.where(
+    tuple_(TodoListModel.created_at, TodoListModel.id)
+    < tuple_(
+        bindparam("after_created_at", type_=TodoListModel.created_at.type),
+        bindparam("after_id", type_=TodoListModel.id.type),
+    ),
+)
+_SELECT_OWNED_TODO_LIST_ID = select(TodoListModel.id).where(*_IS_OWNED_TODO_LIST)
+_SELECT_OWNED_TODO_LIST_IDS = select(TodoListModel.id).where(
+    TodoListModel.id == any_(_TODO_IDS), TodoListModel.user_id == bindparam("owner_id"),
+)
+_RELOAD_TODO_LISTS = (
+    select(TodoListModel)
+    .options(selectinload(TodoListModel.todo_items), raiseload("*"))
+    .where(TodoListModel.id == any_(_TODO_IDS))
+    .execution_options(populate_existing=True)
+)
+# Checks ownership and reads the transaction timestamp the created_at/updated_at server defaults will use
+_SELECT_OWNED_TODO_LIST_NOW = select(func.now()).select_from(TodoListModel).where(*_IS_OWNED_TODO_LIST)
+_INSERT_TODO_LIST = insert(TodoListModel).returning(TodoListModel)
+_DELETE_TODO_LIST = delete(TodoListModel).where(*_IS_OWNED_TODO_LIST)
+_DELETE_TODO_LISTS = (
+    delete(TodoListModel)
+    .where(TodoListModel.id == any_(_TODO_IDS), TodoListModel.user_id == bindparam("owner_id"))
+    .returning(TodoListModel.id)
+)
+_COUNT_TODO_LISTS = (
+    select(func.count()).select_from(TodoListModel).where(TodoListModel.user_id == bindparam("owner_id"))
+)
+
+# Items are returned on their own, so their todo relationship raises instead of lazy loading the parent
+_SELECT_TODO_LIST_ITEM = (
+    select(TodoListItemModel)
+    .options(raiseload("*"))
+    .join(*_TODO_LIST_ITEMS_JOIN)
+    .where(*_IS_OWNED_TODO_LIST, TodoListItemModel.id == bindparam("item_id"))
+)
+_TODO_LIST_ITEMS = (
+    select(TodoListItemModel)
+    .options(raiseload("*"))
+    .join(*_TODO_LIST_ITEMS_JOIN)
+    .where(*_IS_OWNED_TODO_LIST)
+    .order_by(TodoListItemModel.created_at, TodoListItemModel.id)
+    .limit(bindparam("limit"))
+)
+_SELECT_TODO_LIST_ITEMS_PAGE = _TODO_LIST_ITEMS.offset(bindparam("skip"))
+# Keyset page: seeks past the cursor row in the (todo_id, created_at, id) index instead of skipping rows
+_SELECT_TODO_LIST_ITEMS_AFTER = _TODO_LIST_ITEMS.where(
+    tuple_(TodoListItemModel.created_at, TodoListItemModel.id)
+    > tuple_(
+        bindparam("after_created_at", type_=TodoListItemModel.created_at.type),
+        bindparam("after_id", type_=TodoListItemModel.id.type),
+    ),
+)
+_SELECT_OWNED_TODO_LIST_ITEM_IDS = (
+    select(TodoListItemModel.id)
+    .join(*_TODO_LIST_ITEMS_JOIN)
+    .where(*_IS_OWNED_TODO_LIST, TodoListItemModel.id == any_(_ITEM_IDS))
+)
+_RELOAD_TODO_LIST_ITEMS = (
+    select(TodoListItemModel)
+    .options(raiseload("*"))
+    .where(TodoListItemModel.id == any_(_ITEM_IDS))
+    .execution_options(populate_existing=True)
+)
+_SELECT_ITEMS_OF_TODO_LIST = (
+    select(TodoListItemModel).options(raiseload("*")).where(TodoListItemModel.todo_id == bindparam("list_id"))
+)
+_INSERT_TODO_LIST_ITEMS = insert(TodoListItemModel).returning(TodoListItemModel)
+# Batches above this size are written with COPY, which skips per-row statement parsing and RETURNING
+_COPY_TODO_LIST_ITEMS_THRESHOLD = 50
+_COPY_TODO_LIST_ITEM_COLUMNS = ("id", "todo_id", "title", "description", "completed")
+# Inserts nothing unless the todo list exists and is owned by the user. Wrapped in from_statement so the
+# parameters are bound like a query's instead of being taken as rows of an ORM bulk insert
+_INSERT_TODO_LIST_ITEM_IF_OWNED = select(TodoListItemModel).from_statement(
+    insert(TodoListItemModel)
+    .from_select(
+        ["todo_id", "title", "description", "completed"],
+        select(
+            TodoListModel.id,
+            bindparam("title", type_=TodoListItemModel.title.type),
+            bindparam("description", type_=TodoListItemModel.description.type),
+            false(),
+        ).where(*_IS_OWNED_TODO_LIST),
+    )
+    .returning(TodoListItemModel),
+)
+_DELETE_TODO_LIST_ITEM = delete(TodoListItemModel).where(
+    TodoListItemModel.todo_id.in_(_SELECT_OWNED_TODO_LIST_ID), TodoListItemModel.id == bindparam("item_id"),
+)
+_DELETE_TODO_LIST_ITEMS = (
+    delete(TodoListItemModel)
+    .where(
+        TodoListItemModel.todo_id.in_(_SELECT_OWNED_TODO_LIST_ID),
+        TodoListItemModel.id == any_(_ITEM_IDS),
+    )
+    .returning(TodoListItemModel.id)
+)
+_COUNT_TODO_LIST_ITEMS = (
+    select(func.count()).select_from(TodoListItemModel).join(*_TODO_LIST_ITEMS_JOIN).where(*_IS_OWNED_TODO_LIST)
+)
+
+
+def _set_fields(data: BaseModel) -> dict[str, Any]:
+    """Collect the fields explicitly set on an update request.
+
+    Equivalent to `model_dump(exclude_unset=True)` for the flat update schemas, which have no aliases or
+    custom serializers, without going through pydantic's serializer.
+
+    Args:
+        data (BaseModel): The update request.
+
+    Returns:
+        dict[str, Any]: The set fields and their values.
+
+    """
+    return {field: getattr(data, field) for field in data.model_fields_set}
+
+
+async def _update_by_primary_key(
+    session: AsyncSession,
+    model: type[TodoListModel] | type[TodoListItemModel],
+    updates: Mapping[uuid.UUID, BaseModel],
+) -> int:
+    """Apply update requests to rows of a model with a SQLAlchemy bulk update by primary key.
+
+    Args:
+        session (AsyncSession): The database session, with its transaction already begun.
+        model (type[TodoListModel] | type[TodoListItemModel]): The model whose rows are updated.
+        updates (Mapping[uuid.UUID, BaseModel]): The update requests keyed by row ID.
+
+    Returns:
+        int: The number of rows that had fields to update.
+
+    """
+    # Patches touching the same columns are grouped so each group goes out as one executemany
+    patches = sorted(
+        ({"id": row_id, **fields} for row_id, data in updates.items() if (fields := _set_fields(data))),
+        key=sorted,
+    )
+    if patches:
+        await session.execute(update(model), patches)
+    return len(patches)
+
+
+@lru_cache
+def _update_todo_list_stmt(columns: frozenset[str]) -> ReturningUpdate[tuple[TodoListModel]]:
+    """Build the UPDATE statement for a todo list once per set of updated columns.
+
+    Args:
+        columns (frozenset[str]): The columns being updated, bound as `new_<column>` parameters.
+
+    Returns:
+        ReturningUpdate[tuple[TodoListModel]]: The UPDATE ... RETURNING statement scoped to the owner.
+
+    """
+    return (
+        update(TodoListModel)
+        .where(*_IS_OWNED_TODO_LIST)
+        .values({column: bindparam(f"new_{column}") for column in sorted(columns)})
+        .returning(TodoListModel)
+    )
+
+
+@lru_cache
+def _update_todo_list_item_stmt(columns: frozenset[str]) -> ReturningUpdate[tuple[TodoListItemModel]]:
+    """Build the UPDATE statement for a todo item once per set of updated columns.
+
+    Args:
+        columns (frozenset[str]): The columns being updated, bound as `new_<column>` parameters.
+
+    Returns:
+        ReturningUpdate[tuple[TodoListItemModel]]: The UPDATE ... RETURNING statement scoped to the owner.
+
+    """
+    return (
+        update(TodoListItemModel)
+        .where(TodoListItemModel.todo_id.in_(_SELECT_OWNED_TODO_LIST_ID), TodoListItemModel.id == bindparam("item_id"))
+        .values({column: bindparam(f"new_{column}") for column in sorted(columns)})
+        .returning(TodoListItemModel)
+    )
+
 
 class TodoPGRepository(TodoRepositoryInterface):
     """PostgreSQL implementation of Todo repository using SQLAlchemy ORM."""
 
-    def __init__(self, database: DatabaseConnection) -> None:
+    def __init__(self, database: DatabaseConnection, *, count_cache_ttl: float = 30) -> None:
         """Initialize the PostgreSQL repository with database connection.
 
         Args:
             database (DatabaseConnection): The database connection instance.
+            count_cache_ttl (float, optional): Seconds a todo list or item count is served from memory. Writes
+                through this repository invalidate the affected counts right away. Defaults to 30.
 
         """
         self.database = database
+        # Totals for the pagination metadata, keyed by user_id and by (user_id, todo_id)
+        self._todo_list_counts: TTLCache[uuid.UUID, int] = TTLCache(maxsize=10_000, ttl=count_cache_ttl)
+        self._todo_list_item_counts: TTLCache[tuple[uuid.UUID, uuid.UUID], int] = TTLCache(
+            maxsize=10_000, ttl=count_cache_ttl,
+        )
 
-    async def _fetch_one(self, session: AsyncSession, query: Select[tuple[T]]) -> T | None:
+    async def _fetch_one(
+        self, session: AsyncSession, query: Select[tuple[T]], params: dict[str, Any] | None = None,
+    ) -> T | None:
         """Fetch one record using SQLAlchemy.
 
         Args:
             session (AsyncSession): The database session.
             query (Select): The SQLAlchemy query to execute.
+            params (dict[str, Any] | None, optional): Values for the query's bind parameters. Defaults to None.
 
         Returns:
             T | None: The fetched record if found, None otherwise.
 
         """
-        result = await session.execute(query)
+        result = await session.execute(query, params)
         return result.scalar_one_or_none()
 
-    async def _fetch_all(self, session: AsyncSession, query: Select[tuple[T]]) -> list[T]:
+    async def _fetch_all(
+        self, session: AsyncSession, query: Select[tuple[T]], params: dict[str, Any] | None = None,
+    ) -> list[T]:
         """Fetch all records using SQLAlchemy.
 
         Args:
             session (AsyncSession): The database session.
             query (Select): The SQLAlchemy query to execute.
+            params (dict[str, Any] | None, optional): Values for the query's bind parameters. Defaults to None.
 
         Returns:
             list[T]: List of all fetched records.
 
         """
-        result = await session.execute(query)
+        result = await session.execute(query, params)
         return list(result.scalars().all())
 
     async def create_todo_list(self, todo_data: TodoListCreateRequest, user_id: uuid.UUID) -> TodoListModel:
@@ -78,18 +323,49 @@ class TodoPGRepository(TodoRepositoryInterface):
             TodoListModel: The created todo list with assigned ID.
 
         """
-        get_logger().debug("Creating new todo list with title: %s for user: %s", todo_data.title, user_id)
+        _log.debug("Creating new todo list with title: %s for user: %s", todo_data.title, user_id)
+        async with self.database.autocommit_session() as session:
+            # Single INSERT ... RETURNING hands back the server generated id and timestamps
+            row = {"title": todo_data.title, "description": todo_data.description, "user_id": user_id}
+            new_todo = (await session.scalars(_INSERT_TODO_LIST, row)).one()
+            self._todo_list_counts.pop(user_id)
+
+            # A new todo has no items yet, so mark the relationship as loaded and empty
+            # instead of issuing a SELECT for it before the session closes
+            set_committed_value(new_todo, "todo_items", [])
+            _log.info("Successfully created todo list with ID: %s for user: %s", new_todo.id, user_id)
+            return new_todo
+
+    async def create_todo_lists(
+        self, todo_data: list[TodoListCreateRequest], user_id: uuid.UUID,
+    ) -> list[TodoListModel]:
+        """Create multiple todo lists using a single bulk INSERT.
+
+        The rows are sent as one executemany, which SQLAlchemy batches into multi-row
+        INSERT ... RETURNING statements instead of one round trip and commit per todo list.
+
+        Args:
+            todo_data (list[TodoListCreateRequest]): The data for the new todo lists.
+            user_id (uuid.UUID): The ID of the user creating the todo lists.
+
+        Returns:
+            list[TodoListModel]: The created todo lists.
+
+        """
+        _log.debug("Creating %s todo lists for user: %s", len(todo_data), user_id)
+        if not todo_data:
+            return []
+
         async with self.database.async_session() as session:
-            new_todo = TodoListModel(title=todo_data.title, description=todo_data.description, user_id=user_id)
-            session.add(new_todo)
+            rows = [{"title": data.title, "description": data.description, "user_id": user_id} for data in todo_data]
+            new_todos = list((await session.scalars(_INSERT_TODO_LIST, rows)).all())
             await session.commit()
-            await session.refresh(new_todo)
+            self._todo_list_counts.pop(user_id)
 
-            # Ensure todo_items relationship is loaded before session closes
-            # For a new todo, this will be an empty list
-            await session.refresh(new_todo, ["todo_items"])
-            get_logger().info("Successfully created todo list with ID: %s for user: %s", new_todo.id, user_id)
-            return new_todo
+        for new_todo in new_todos:
+            set_committed_value(new_todo, "todo_items", [])
+        _log.info("Successfully created %s todo lists for user: %s", len(new_todos), user_id)
+        return new_todos
 
     async def get_todo_list_by_id(self, todo_id: uuid.UUID, user_id: uuid.UUID) -> TodoListModel | None:
         """Get todo by ID for a specific user using SQLAlchemy fetch_one equivalent.
@@ -102,18 +378,13 @@ class TodoPGRepository(TodoRepositoryInterface):
             TodoListModel | None: The todo list if found and owned by user, None otherwise.
 
         """
-        get_logger().debug("Fetching todo list by ID: %s for user: %s", todo_id, user_id)
-        async with self.database.async_session() as session:
-            query = (
-                select(TodoListModel)
-                .options(selectinload(TodoListModel.todo_items))
-                .where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-            )
-            result = await self._fetch_one(session, query)
+        _log.debug("Fetching todo list by ID: %s for user: %s", todo_id, user_id)
+        async with self.database.autocommit_session() as session:
+            result = await self._fetch_one(session, _SELECT_TODO_LIST, {"list_id": todo_id, "owner_id": user_id})
             if result:
-                get_logger().info("Successfully retrieved todo list ID: %s for user: %s", todo_id, user_id)
+                _log.debug("Successfully retrieved todo list ID: %s for user: %s", todo_id, user_id)
             else:
-                get_logger().warning("Todo list with ID: %s not found for user: %s", todo_id, user_id)
+                _log.warning("Todo list with ID: %s not found for user: %s", todo_id, user_id)
             return result
 
     async def get_all_todo_lists(self, user_id: uuid.UUID, skip: int = 0, limit: int = 100) -> list[TodoListModel]:
@@ -128,18 +399,38 @@ class TodoPGRepository(TodoRepositoryInterface):
             list[TodoListModel]: List of todo lists for the user.
 
         """
-        get_logger().debug("Fetching all todo lists for user: %s with skip: %s, limit: %s", user_id, skip, limit)
-        async with self.database.async_session() as session:
-            query = (
-                select(TodoListModel)
-                .options(selectinload(TodoListModel.todo_items))
-                .where(TodoListModel.user_id == user_id)
-                .offset(skip)
-                .limit(limit)
-                .order_by(TodoListModel.created_at.desc())
-            )
-            result = await self._fetch_all(session, query)
-            get_logger().info("Successfully retrieved %s todo lists for user: %s", len(result), user_id)
+        _log.debug("Fetching all todo lists for user: %s with skip: %s, limit: %s", user_id, skip, limit)
+        async with self.database.autocommit_session() as session:
+            params = {"owner_id": user_id, "skip": skip, "limit": limit}
+            result = await self._fetch_all(session, _SELECT_TODO_LISTS_PAGE, params)
+            _log.debug("Successfully retrieved %s todo lists for user: %s", len(result), user_id)
+            return result
+
+    async def get_todo_list_summaries(
+        self, user_id: uuid.UUID, skip: int = 0, limit: int = 100, after: PageCursor | None = None,
+    ) -> Sequence[RowMapping]:
+        """Get the columns of a user's todo lists, without their items, as plain rows.
+
+        Args:
+            user_id (uuid.UUID): The ID of the user whose todos to retrieve.
+            skip (int, optional): Number of records to skip. Ignored when `after` is given. Defaults to 0.
+            limit (int, optional): Maximum number of records to return. Defaults to 100.
+            after (PageCursor | None, optional): Sort key of the last row of the previous page. When given, the
+                page starts right after it instead of at an offset. Defaults to None.
+
+        Returns:
+            Sequence[RowMapping]: Rows with the id, title, description, created_at and updated_at of each todo list.
+
+        """
+        _log.debug("Fetching todo list summaries for user: %s with skip: %s, limit: %s", user_id, skip, limit)
+        async with self.database.autocommit_session() as session:
+            params = {"owner_id": user_id, "skip": skip, "limit": limit}
+            query = _SELECT_TODO_LIST_SUMMARIES_PAGE
+            if after is not None:
+                query = _SELECT_TODO_LIST_SUMMARIES_AFTER
+                params |= {"after_created_at": after[0], "after_id": after[1]}
+            result = (await session.execute(query, params)).mappings().all()
+            _log.debug("Successfully retrieved %s todo lists for user: %s", len(result), user_id)
             return result
 
     async def update_todo_list(
@@ -156,47 +447,79 @@ class TodoPGRepository(TodoRepositoryInterface):
             TodoListModel | None: The updated todo list if found and owned by user, None otherwise.
 
         """
-        get_logger().debug("Updating todo list with ID: %s for user: %s", todo_id, user_id)
+        _log.debug("Updating todo list with ID: %s for user: %s", todo_id, user_id)
         async with self.database.async_session() as session:
             # Perform direct update and check affected rows
-            update_data = todo_data.model_dump(exclude_unset=True)
+            update_data = _set_fields(todo_data)
             if not update_data:
-                get_logger().info("No fields to update for todo list ID: %s, returning existing todo", todo_id)
+                _log.debug("No fields to update for todo list ID: %s, returning existing todo", todo_id)
                 # No fields to update, fetch and return existing todo
-                query = (
-                    select(TodoListModel)
-                    .options(selectinload(TodoListModel.todo_items))
-                    .where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-                )
-                todo_list = await self._fetch_one(session, query)
+                todo_list = await self._fetch_one(session, _SELECT_TODO_LIST, {"list_id": todo_id, "owner_id": user_id})
                 if not todo_list:
-                    get_logger().warning("Todo list with ID: %s not found for user: %s for update", todo_id, user_id)
+                    _log.warning("Todo list with ID: %s not found for user: %s for update", todo_id, user_id)
                     return None
-                get_logger().info("Returning existing todo list ID: %s for user: %s", todo_id, user_id)
+                _log.debug("Returning existing todo list ID: %s for user: %s", todo_id, user_id)
                 return todo_list
 
-            get_logger().debug("Updating todo list ID: %s for user: %s with data: %s", todo_id, user_id, update_data)
-            stmt = (
-                update(TodoListModel)
-                .where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-                .values(**update_data)
-                .returning(TodoListModel)
-            )
-            result = await session.execute(stmt)
+            _log.debug("Updating todo list ID: %s for user: %s with data: %s", todo_id, user_id, update_data)
+            stmt = _update_todo_list_stmt(frozenset(update_data))
+            params = {"list_id": todo_id, "owner_id": user_id} | {f"new_{k}": v for k, v in update_data.items()}
+            result = await session.execute(stmt, params)
             updated_todo = result.scalar_one_or_none()
 
             # Check if any rows were affected (todo exists and is owned by user)
             if updated_todo is None:
-                get_logger().warning("Todo list with ID: %s not found for user: %s for update", todo_id, user_id)
+                _log.warning("Todo list with ID: %s not found for user: %s for update", todo_id, user_id)
                 return None
 
-            await session.commit()
-            get_logger().info("Successfully updated todo list ID: %s for user: %s", todo_id, user_id)
+            # Load the todo_items relationship inside the same transaction instead of refreshing after commit,
+            # which would open a second one
+            todo_items = await self._fetch_all(session, _SELECT_ITEMS_OF_TODO_LIST, {"list_id": todo_id})
+            set_committed_value(updated_todo, "todo_items", todo_items)
 
-            # Load the todo_items relationship for the updated todo
-            await session.refresh(updated_todo, ["todo_items"])
+            await session.commit()
+            _log.info("Successfully updated todo list ID: %s for user: %s", todo_id, user_id)
             return updated_todo
 
+    async def update_todo_lists(
+        self, todo_data: dict[uuid.UUID, TodoListUpdateRequest], user_id: uuid.UUID,
+    ) -> list[TodoListModel] | None:
+        """Update multiple todo lists for a specific user using a SQLAlchemy bulk update by primary key.
+
+        Ownership of every todo list is checked up front, then all patches are sent as one executemany
+        UPDATE instead of one statement and commit per todo list. Either all todo lists are updated or none.
+
+        Args:
+            todo_data (dict[uuid.UUID, TodoListUpdateRequest]): The updated data keyed by todo list ID.
+            user_id (uuid.UUID): The ID of the user updating the todo lists.
+
+        Returns:
+            list[TodoListModel] | None: The updated todo lists if all of them are owned by user, None otherwise.
+
+        """
+        _log.debug("Updating %s todo lists for user: %s", len(todo_data), user_id)
+        if not todo_data:
+            return []
+
+        todo_ids = list(todo_data)
+        async with self.database.async_session() as session:
+            params = {"todo_ids": todo_ids, "owner_id": user_id}
+            owned_ids = await self._fetch_all(session, _SELECT_OWNED_TODO_LIST_IDS, params)
+            if len(owned_ids) != len(todo_ids):
+                _log.warning(
+                    "%s of %s todo lists not found for user: %s for update",
+                    len(todo_ids) - len(owned_ids),
+                    len(todo_ids),
+                    user_id,
+                )
+                return None
+
+            updated_count = await _update_by_primary_key(session, TodoListModel, todo_data)
+            updated_todos = await self._fetch_all(session, _RELOAD_TODO_LISTS, {"todo_ids": todo_ids})
+            await session.commit()
+            _log.info("Successfully updated %s todo lists for user: %s", updated_count, user_id)
+            return updated_todos
+
     async def delete_todo_list(self, todo_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Delete todo by ID for a specific user using SQLAlchemy direct delete.
 
@@ -208,21 +531,54 @@ class TodoPGRepository(TodoRepositoryInterface):
             bool: True if the todo list was deleted, False if not found or not owned by user.
 
         """
-        get_logger().debug("Deleting todo list with ID: %s for user: %s", todo_id, user_id)
-        async with self.database.async_session() as session:
+        _log.debug("Deleting todo list with ID: %s for user: %s", todo_id, user_id)
+        async with self.database.autocommit_session() as session:
             # Perform direct delete and check affected rows
-            stmt = delete(TodoListModel).where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-            result = await session.execute(stmt)
+            result = await session.execute(_DELETE_TODO_LIST, {"list_id": todo_id, "owner_id": user_id})
 
-            await session.commit()
             # Return True if any rows were deleted (todo existed and was owned by user)
             deleted = result.rowcount > 0
             if deleted:
-                get_logger().info("Successfully deleted todo list ID: %s for user: %s", todo_id, user_id)
+                self._todo_list_counts.pop(user_id)
+                self._todo_list_item_counts.pop((user_id, todo_id))
+                _log.info("Successfully deleted todo list ID: %s for user: %s", todo_id, user_id)
             else:
-                get_logger().warning("Todo list with ID: %s not found for user: %s for deletion", todo_id, user_id)
+                _log.warning("Todo list with ID: %s not found for user: %s for deletion", todo_id, user_id)
             return deleted
 
+    async def delete_todo_lists(self, todo_ids: list[uuid.UUID], user_id: uuid.UUID) -> list[uuid.UUID]:
+        """Delete multiple todos for a specific user using a single SQLAlchemy direct delete.
+
+        Items are removed by the ON DELETE CASCADE foreign key in the same statement. Either all todo lists
+        are deleted or none.
+
+        Args:
+            todo_ids (list[uuid.UUID]): The IDs of the todo lists to delete.
+            user_id (uuid.UUID): The ID of the user deleting the todo lists.
+
+        Returns:
+            list[uuid.UUID]: The IDs that were not found or not owned by user. Empty if all were deleted.
+
+        """
+        _log.debug("Deleting %s todo lists for user: %s", len(todo_ids), user_id)
+        async with self.database.async_session() as session:
+            params = {"todo_ids": todo_ids, "owner_id": user_id}
+            deleted_ids = set((await session.scalars(_DELETE_TODO_LISTS, params)).all())
+            missing_ids = [todo_id for todo_id in todo_ids if todo_id not in deleted_ids]
+            if missing_ids:
+                await session.rollback()
+                _log.warning(
+                    "Todo lists with IDs: %s not found for user: %s for deletion", missing_ids, user_id,
+                )
+                return missing_ids
+
+            await session.commit()
+            self._todo_list_counts.pop(user_id)
+            for todo_id in deleted_ids:
+                self._todo_list_item_counts.pop((user_id, todo_id))
+            _log.info("Successfully deleted %s todo lists for user: %s", len(deleted_ids), user_id)
+            return []
+
     async def add_todo_list_item(
         self, todo_id: uuid.UUID, item_data: TodoListItemsAddRequest, user_id: uuid.UUID,
     ) -> TodoListItemModel | None:
@@ -237,75 +593,187 @@ class TodoPGRepository(TodoRepositoryInterface):
             TodoListItemModel | None: The created todo item if the list exists and is owned by user, None otherwise.
 
         """
-        get_logger().debug(
+        _log.debug(
             "Adding item to todo list ID: %s with title: %s for user: %s", todo_id, item_data.title, user_id,
         )
         async with self.database.async_session() as session:
-            # First verify the todo list exists and is owned by the user
-            todo_query = select(TodoListModel).where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-            todo_exists = await self._fetch_one(session, todo_query)
-
-            if not todo_exists:
-                get_logger().warning("Todo list ID: %s not found for user: %s", todo_id, user_id)
-                return None
-
             try:
-                # Create new item
-                new_item = TodoListItemModel(
-                    todo_id=todo_id,
-                    title=item_data.title,
-                    description=item_data.description,
-                    completed=False,
-                )
-
-                session.add(new_item)
+                # Create new item only if the todo list is owned by the user, getting the server generated
+                # columns back from the same statement
+                params = {
+                    "list_id": todo_id,
+                    "owner_id": user_id,
+                    "title": item_data.title,
+                    "description": item_data.description,
+                }
+                new_item = (await session.scalars(_INSERT_TODO_LIST_ITEM_IF_OWNED, params)).one_or_none()
+                if new_item is None:
+                    _log.warning("Todo list ID: %s not found for user: %s", todo_id, user_id)
+                    return None
                 await session.commit()
-                await session.refresh(new_item)
-                get_logger().info(
+                self._todo_list_item_counts.pop((user_id, todo_id))
+                _log.info(
                     "Successfully added item ID: %s to todo list ID: %s for user: %s", new_item.id, todo_id, user_id,
                 )
             except IntegrityError:
                 # If foreign key constraint fails, rollback and return None
                 await session.rollback()
-                get_logger().warning(
+                _log.warning(
                     "Failed to add item to todo list ID: %s for user: %s - integrity error", todo_id, user_id,
                 )
                 return None
             else:
                 return new_item
 
+    async def add_todo_list_items(
+        self, todo_id: uuid.UUID, items_data: list[TodoListItemsAddRequest], user_id: uuid.UUID,
+    ) -> list[TodoListItemModel] | None:
+        """Add multiple todo items to a user's todo using a single bulk INSERT or COPY.
+
+        The rows are sent as one executemany, which SQLAlchemy batches into multi-row
+        INSERT ... RETURNING statements instead of one round trip per item. Batches larger
+        than _COPY_TODO_LIST_ITEMS_THRESHOLD are streamed with COPY instead.
+
+        Args:
+            todo_id (uuid.UUID): The ID of the todo list to add the items to.
+            items_data (list[TodoListItemsAddRequest]): The data for the new todo items.
+            user_id (uuid.UUID): The ID of the user adding the items.
+
+        Returns:
+            list[TodoListItemModel] | None: The created todo items if the list exists and is owned by user,
+                None otherwise.
+
+        """
+        _log.debug("Adding %s items to todo list ID: %s for user: %s", len(items_data), todo_id, user_id)
+        async with self.database.async_session() as session:
+            # First verify the todo list exists and is owned by the user
+            params = {"list_id": todo_id, "owner_id": user_id}
+            created_at = await self._fetch_one(session, _SELECT_OWNED_TODO_LIST_NOW, params)
+
+            if created_at is None:
+                _log.warning("Todo list ID: %s not found for user: %s", todo_id, user_id)
+                return None
+
+            if not items_data:
+                return []
+
+            try:
+                if len(items_data) > _COPY_TODO_LIST_ITEMS_THRESHOLD:
+                    new_items = await self._copy_todo_list_items(session, todo_id, items_data, created_at)
+                    await session.commit()
+                    self._todo_list_item_counts.pop((user_id, todo_id))
+                    _log.info(
+                        "Successfully copied %s items to todo list ID: %s for user: %s",
+                        len(new_items),
+                        todo_id,
+                        user_id,
+                    )
+                    return new_items
+
+                rows = [
+                    {
+                        "todo_id": todo_id,
+                        "title": item_data.title,
+                        "description": item_data.description,
+                        "completed": False,
+                    }
+                    for item_data in items_data
+                ]
+                result = await session.scalars(_INSERT_TODO_LIST_ITEMS, rows)
+                new_items = list(result.all())
+                await session.commit()
+                self._todo_list_item_counts.pop((user_id, todo_id))
+                _log.info(
+                    "Successfully added %s items to todo list ID: %s for user: %s", len(new_items), todo_id, user_id,
+                )
+            except (IntegrityError, asyncpg.IntegrityConstraintViolationError):
+                # If foreign key constraint fails, rollback and return None
+                await session.rollback()
+                _log.warning(
+                    "Failed to add items to todo list ID: %s for user: %s - integrity error", todo_id, user_id,
+                )
+                return None
+            else:
+                return new_items
+
+    async def _copy_todo_list_items(
+        self,
+        session: AsyncSession,
+        todo_id: uuid.UUID,
+        items_data: list[TodoListItemsAddRequest],
+        created_at: datetime,
+    ) -> list[TodoListItemModel]:
+        """Write todo items with COPY on the session's connection.
+
+        Ids are generated here rather than read back, and created_at/updated_at are left to their
+        server defaults, which within the transaction equal the given created_at.
+
+        Args:
+            session (AsyncSession): The database session, with its transaction already begun.
+            todo_id (uuid.UUID): The ID of the todo list to add the items to.
+            items_data (list[TodoListItemsAddRequest]): The data for the new todo items.
+            created_at (datetime): The transaction timestamp, from now().
+
+        Returns:
+            list[TodoListItemModel]: The created todo items, in the order given.
+
+        """
+        new_items = [
+            TodoListItemModel(
+                id=uuid7(),
+                todo_id=todo_id,
+                title=item_data.title,
+                description=item_data.description,
+                completed=False,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for item_data in items_data
+        ]
+        connection = await (await session.connection()).get_raw_connection()
+        driver_connection: asyncpg.Connection = connection.driver_connection
+        await driver_connection.copy_records_to_table(
+            TodoListItemModel.__tablename__,
+            records=[(item.id, item.todo_id, item.title, item.description, item.completed) for item in new_items],
+            columns=_COPY_TODO_LIST_ITEM_COLUMNS,
+        )
+        return new_items
+
     async def get_todo_list_items(
-        self, todo_id: uuid.UUID, user_id: uuid.UUID, skip: int = 0, limit: int = 100,
+        self,
+        todo_id: uuid.UUID,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[TodoListItemModel]:
         """Get todo items for a specific user's todo using SQLAlchemy fetch_all equivalent.
 
         Args:
             todo_id (uuid.UUID): The ID of the todo list to get items from.
             user_id (uuid.UUID): The ID of the user requesting the items.
-            skip (int, optional): Number of records to skip. Defaults to 0.
+            skip (int, optional): Number of records to skip. Ignored when `after` is given. Defaults to 0.
             limit (int, optional): Maximum number of records to return. Defaults to 100.
+            after (PageCursor | None, optional): Sort key of the last item of the previous page. When given, the
+                page starts right after it instead of at an offset. Defaults to None.
 
         Returns:
             list[TodoListItemModel]: List of todo items for the specified todo list if owned by user.
                                    Returns empty list if todo doesn't exist or isn't owned by user.
 
         """
-        get_logger().debug(
+        _log.debug(
             "Fetching items for todo list ID: %s for user: %s with skip: %s, limit: %s", todo_id, user_id, skip, limit,
         )
-        async with self.database.async_session() as session:
+        async with self.database.autocommit_session() as session:
             # Join with TodoListModel to ensure user ownership
-            query = (
-                select(TodoListItemModel)
-                .join(TodoListModel, TodoListItemModel.todo_id == TodoListModel.id)
-                .where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-                .order_by(TodoListItemModel.created_at)
-                .offset(skip)
-                .limit(limit)
-            )
-
-            result = await self._fetch_all(session, query)
-            get_logger().info(
+            params = {"list_id": todo_id, "owner_id": user_id, "skip": skip, "limit": limit}
+            query = _SELECT_TODO_LIST_ITEMS_PAGE
+            if after is not None:
+                query = _SELECT_TODO_LIST_ITEMS_AFTER
+                params |= {"after_created_at": after[0], "after_id": after[1]}
+            result = await self._fetch_all(session, query, params)
+            _log.debug(
                 "Successfully retrieved %s items for todo list ID: %s for user: %s", len(result), todo_id, user_id,
             )
             return result
@@ -329,27 +797,22 @@ class TodoPGRepository(TodoRepositoryInterface):
             TodoListItemModel | None: The updated todo item if found and owned by user, None otherwise.
 
         """
-        get_logger().debug("Updating todo item ID: %s in todo list ID: %s for user: %s", item_id, todo_id, user_id)
-        async with self.database.async_session() as session:
+        _log.debug("Updating todo item ID: %s in todo list ID: %s for user: %s", item_id, todo_id, user_id)
+        # Reads the item back when there is nothing to set, otherwise updates it with UPDATE ... RETURNING
+        async with self.database.autocommit_session() as session:
             # Perform direct update and check affected rows
-            update_data = item_data.model_dump(exclude_unset=True)
+            update_data = _set_fields(item_data)
             if not update_data:
-                get_logger().info(
+                _log.debug(
                     "No fields to update for todo item ID: %s in todo list ID: %s, returning existing item",
                     item_id,
                     todo_id,
                 )
                 # No fields to update, fetch and return existing item
-                query = (
-                    select(TodoListItemModel)
-                    .join(TodoListModel, TodoListItemModel.todo_id == TodoListModel.id)
-                    .where(
-                        TodoListModel.id == todo_id, TodoListModel.user_id == user_id, TodoListItemModel.id == item_id,
-                    )
-                )
-                todo_list_item = await self._fetch_one(session, query)
+                params = {"list_id": todo_id, "owner_id": user_id, "item_id": item_id}
+                todo_list_item = await self._fetch_one(session, _SELECT_TODO_LIST_ITEM, params)
                 if not todo_list_item:
-                    get_logger().warning(
+                    _log.warning(
                         "Todo item ID: %s not found in todo list ID: %s for user: %s for update",
                         item_id,
                         todo_id,
@@ -358,7 +821,7 @@ class TodoPGRepository(TodoRepositoryInterface):
                     return None
                 return todo_list_item
 
-            get_logger().debug(
+            _log.debug(
                 "Updating todo item ID: %s in todo list ID: %s for user: %s with data: %s",
                 item_id,
                 todo_id,
@@ -366,29 +829,71 @@ class TodoPGRepository(TodoRepositoryInterface):
                 update_data,
             )
             # Update with subquery to ensure user ownership
-            subquery = select(TodoListModel.id).where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-            stmt = (
-                update(TodoListItemModel)
-                .where(TodoListItemModel.todo_id.in_(subquery), TodoListItemModel.id == item_id)
-                .values(**update_data)
-                .returning(TodoListItemModel)
-            )
-            result = await session.execute(stmt)
+            stmt = _update_todo_list_item_stmt(frozenset(update_data))
+            params = {"list_id": todo_id, "owner_id": user_id, "item_id": item_id}
+            result = await session.execute(stmt, params | {f"new_{k}": v for k, v in update_data.items()})
             updated_item = result.scalar_one_or_none()
 
             # Check if any rows were affected (item exists and belongs to user's todo)
             if updated_item is None:
-                get_logger().warning(
+                _log.warning(
                     "Todo item ID: %s not found in todo list ID: %s for user: %s for update", item_id, todo_id, user_id,
                 )
                 return None
 
-            await session.commit()
-            get_logger().info(
+            _log.info(
                 "Successfully updated todo item ID: %s in todo list ID: %s for user: %s", item_id, todo_id, user_id,
             )
             return updated_item
 
+    async def update_todo_list_items(
+        self,
+        todo_id: uuid.UUID,
+        items_data: dict[uuid.UUID, TodoListItemUpdateRequest],
+        user_id: uuid.UUID,
+    ) -> list[TodoListItemModel] | None:
+        """Update multiple todo items for a specific user using a SQLAlchemy bulk update by primary key.
+
+        Ownership of every item is checked up front, then all patches are sent as one executemany
+        UPDATE instead of one statement and commit per item. Either all items are updated or none.
+
+        Args:
+            todo_id (uuid.UUID): The ID of the todo list containing the items.
+            items_data (dict[uuid.UUID, TodoListItemUpdateRequest]): The updated data keyed by todo item ID.
+            user_id (uuid.UUID): The ID of the user updating the items.
+
+        Returns:
+            list[TodoListItemModel] | None: The updated todo items if all of them were found in the user's todo list,
+                None otherwise.
+
+        """
+        _log.debug("Updating %s items in todo list ID: %s for user: %s", len(items_data), todo_id, user_id)
+        if not items_data:
+            return []
+
+        item_ids = list(items_data)
+        async with self.database.async_session() as session:
+            # Join with TodoListModel to ensure user ownership of every item
+            params = {"list_id": todo_id, "owner_id": user_id, "item_ids": item_ids}
+            owned_ids = await self._fetch_all(session, _SELECT_OWNED_TODO_LIST_ITEM_IDS, params)
+            if len(owned_ids) != len(item_ids):
+                _log.warning(
+                    "%s of %s todo items not found in todo list ID: %s for user: %s for update",
+                    len(item_ids) - len(owned_ids),
+                    len(item_ids),
+                    todo_id,
+                    user_id,
+                )
+                return None
+
+            updated_count = await _update_by_primary_key(session, TodoListItemModel, items_data)
+            updated_items = await self._fetch_all(session, _RELOAD_TODO_LIST_ITEMS, {"item_ids": item_ids})
+            await session.commit()
+            _log.info(
+                "Successfully updated %s items in todo list ID: %s for user: %s", updated_count, todo_id, user_id,
+            )
+            return updated_items
+
     async def delete_todo_list_item(self, todo_id: uuid.UUID, item_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Delete a todo item for a specific user using SQLAlchemy direct delete.
 
@@ -401,27 +906,24 @@ class TodoPGRepository(TodoRepositoryInterface):
             bool: True if the todo item was deleted, False if not found or not owned by user.
 
         """
-        get_logger().debug("Deleting todo item ID: %s from todo list ID: %s for user: %s", item_id, todo_id, user_id)
-        async with self.database.async_session() as session:
+        _log.debug("Deleting todo item ID: %s from todo list ID: %s for user: %s", item_id, todo_id, user_id)
+        async with self.database.autocommit_session() as session:
             # Delete with subquery to ensure user ownership
-            subquery = select(TodoListModel.id).where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-            stmt = delete(TodoListItemModel).where(
-                TodoListItemModel.todo_id.in_(subquery), TodoListItemModel.id == item_id,
-            )
-            result = await session.execute(stmt)
+            params = {"list_id": todo_id, "owner_id": user_id, "item_id": item_id}
+            result = await session.execute(_DELETE_TODO_LIST_ITEM, params)
 
-            await session.commit()
             # Return True if any rows were deleted (item existed and belonged to user's todo)
             deleted = result.rowcount > 0
             if deleted:
-                get_logger().info(
+                self._todo_list_item_counts.pop((user_id, todo_id))
+                _log.info(
                     "Successfully deleted todo item ID: %s from todo list ID: %s for user: %s",
                     item_id,
                     todo_id,
                     user_id,
                 )
             else:
-                get_logger().warning(
+                _log.warning(
                     "Todo item ID: %s not found in todo list ID: %s for user: %s for deletion",
                     item_id,
                     todo_id,
@@ -429,9 +931,50 @@ class TodoPGRepository(TodoRepositoryInterface):
                 )
             return deleted
 
+    async def delete_todo_list_items(
+        self, todo_id: uuid.UUID, item_ids: list[uuid.UUID], user_id: uuid.UUID,
+    ) -> list[uuid.UUID]:
+        """Delete multiple todo items for a specific user using a single SQLAlchemy direct delete.
+
+        Either all todo items are deleted or none.
+
+        Args:
+            todo_id (uuid.UUID): The ID of the todo list containing the items.
+            item_ids (list[uuid.UUID]): The IDs of the todo items to delete.
+            user_id (uuid.UUID): The ID of the user deleting the items.
+
+        Returns:
+            list[uuid.UUID]: The IDs that were not found in the user's todo list. Empty if all were deleted.
+
+        """
+        _log.debug("Deleting %s items from todo list ID: %s for user: %s", len(item_ids), todo_id, user_id)
+        async with self.database.async_session() as session:
+            # Delete with subquery to ensure user ownership
+            params = {"list_id": todo_id, "owner_id": user_id, "item_ids": item_ids}
+            deleted_ids = set((await session.scalars(_DELETE_TODO_LIST_ITEMS, params)).all())
+            missing_ids = [item_id for item_id in item_ids if item_id not in deleted_ids]
+            if missing_ids:
+                await session.rollback()
+                _log.warning(
+                    "Todo items with IDs: %s not found in todo list ID: %s for user: %s for deletion",
+                    missing_ids,
+                    todo_id,
+                    user_id,
+                )
+                return missing_ids
+
+            await session.commit()
+            self._todo_list_item_counts.pop((user_id, todo_id))
+            _log.info(
+                "Successfully deleted %s items from todo list ID: %s for user: %s", len(deleted_ids), todo_id, user_id,
+            )
+            return []
+
     async def count_todo_lists(self, user_id: uuid.UUID) -> int:
         """Count the total number of todo lists for a specific user in the database.
 
+        The count is cached for count_cache_ttl seconds and invalidated by writes through this repository.
+
         Args:
             user_id (uuid.UUID): The ID of the user whose todos to count.
 
@@ -439,14 +982,20 @@ class TodoPGRepository(TodoRepositoryInterface):
             int: Total number of todo lists for the user.
 
         """
-        async with self.database.async_session() as session:
-            query = select(func.count()).select_from(TodoListModel).where(TodoListModel.user_id == user_id)
-            result = await session.execute(query)
-            return result.scalar_one()
+        count = self._todo_list_counts.get(user_id)
+        if count is not None:
+            return count
+        async with self.database.autocommit_session() as session:
+            result = await session.execute(_COUNT_TODO_LISTS, {"owner_id": user_id})
+            count = result.scalar_one()
+        self._todo_list_counts.set(user_id, count)
+        return count
 
     async def count_todo_list_items(self, todo_id: uuid.UUID, user_id: uuid.UUID) -> int:
         """Count the total number of items in a specific user's todo list.
 
+        The count is cached for count_cache_ttl seconds and invalidated by writes through this repository.
+
         Args:
             todo_id (uuid.UUID): The ID of the todo list to count items for.
             user_id (uuid.UUID): The ID of the user who owns the todo list.
@@ -455,13 +1004,12 @@ class TodoPGRepository(TodoRepositoryInterface):
             int: Total number of items in the todo list if owned by user, 0 otherwise.
 
         """
-        async with self.database.async_session() as session:
+        count = self._todo_list_item_counts.get((user_id, todo_id))
+        if count is not None:
+            return count
+        async with self.database.autocommit_session() as session:
             # Join with TodoListModel to ensure user ownership
-            query = (
-                select(func.count())
-                .select_from(TodoListItemModel)
-                .join(TodoListModel, TodoListItemModel.todo_id == TodoListModel.id)
-                .where(TodoListModel.id == todo_id, TodoListModel.user_id == user_id)
-            )
-            result = await session.execute(query)
-            return result.scalar_one()
+            result = await session.execute(_COUNT_TODO_LIST_ITEMS, {"list_id": todo_id, "owner_id": user_id})
+            count = result.scalar_one()
+        self._todo_list_item_counts.set((user_id, todo_id), count)
+        return count
@@ -6,8 +6,10 @@ providing a contract for different repository implementations.
 
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
@@ -18,23 +20,34 @@ from app.schemas.todo_schema import (
     TodoListItemUpdateRequest,
     TodoListUpdateRequest,
 )
+from app.utils.cursor_util import PageCursor
 
 
 class TodoRepositoryInterface(ABC):
     """Abstract base class defining the interface for Todo repository operations."""
 
     @abstractmethod
-    async def _fetch_one(self, session: AsyncSession, query: Select) -> object | None:
+    async def _fetch_one(
+        self, session: AsyncSession, query: Select, params: dict[str, Any] | None = None,
+    ) -> object | None:
         """Execute a SELECT query to fetch a single record."""
 
     @abstractmethod
-    async def _fetch_all(self, session: AsyncSession, query: Select) -> list[Any]:
+    async def _fetch_all(
+        self, session: AsyncSession, query: Select, params: dict[str, Any] | None = None,
+    ) -> list[Any]:
         """Execute a SELECT query to fetch multiple records."""
 
     @abstractmethod
     async def create_todo_list(self, todo_data: TodoListCreateRequest, user_id: uuid.UUID) -> TodoListModel:
         """Create a new todo list for a specific user."""
 
+    @abstractmethod
+    async def create_todo_lists(
+        self, todo_data: list[TodoListCreateRequest], user_id: uuid.UUID,
+    ) -> list[TodoListModel]:
+        """Create multiple todo lists for a user in a single statement."""
+
     @abstractmethod
     async def get_todo_list_by_id(self, todo_id: uuid.UUID, user_id: uuid.UUID) -> TodoListModel | None:
         """Get a todo list by its ID for a specific user."""
@@ -45,25 +58,52 @@ class TodoRepositoryInterface(ABC):
     ) -> list[TodoListModel]:
         """Retrieve all todo lists for a user with pagination."""
 
+    @abstractmethod
+    async def get_todo_list_summaries(
+        self, user_id: uuid.UUID, skip: int = 0, limit: int = 100, after: PageCursor | None = None,
+    ) -> Sequence[RowMapping]:
+        """Retrieve the columns of a user's todo lists, without their items, with pagination."""
+
     @abstractmethod
     async def update_todo_list(
         self, todo_id: uuid.UUID, todo_data: TodoListUpdateRequest, user_id: uuid.UUID,
     ) -> TodoListModel | None:
         """Update a user's todo list by ID."""
 
+    @abstractmethod
+    async def update_todo_lists(
+        self, todo_data: dict[uuid.UUID, TodoListUpdateRequest], user_id: uuid.UUID,
+    ) -> list[TodoListModel] | None:
+        """Update multiple todo lists of a user at once, or none if any of them is not found."""
+
     @abstractmethod
     async def delete_todo_list(self, todo_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Delete a user's todo list by ID."""
 
+    @abstractmethod
+    async def delete_todo_lists(self, todo_ids: list[uuid.UUID], user_id: uuid.UUID) -> list[uuid.UUID]:
+        """Delete multiple todo lists of a user in one statement, returning the IDs that were not found."""
+
     @abstractmethod
     async def add_todo_list_item(
         self, todo_id: uuid.UUID, item_data: TodoListItemsAddRequest, user_id: uuid.UUID,
     ) -> TodoListItemModel | None:
         """Add an item to a user's todo list."""
 
+    @abstractmethod
+    async def add_todo_list_items(
+        self, todo_id: uuid.UUID, items_data: list[TodoListItemsAddRequest], user_id: uuid.UUID,
+    ) -> list[TodoListItemModel] | None:
+        """Add multiple items to a user's todo list in one transaction, or none if the list is not owned."""
+
     @abstractmethod
     async def get_todo_list_items(
-        self, todo_id: uuid.UUID, user_id: uuid.UUID, skip: int = 0, limit: int = 100,
+        self,
+        todo_id: uuid.UUID,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[TodoListItemModel]:
         """Get items from a user's todo list with pagination."""
 
@@ -77,12 +117,27 @@ class TodoRepositoryInterface(ABC):
     ) -> TodoListItemModel | None:
         """Update a user's todo item in a specific todo list."""
 
+    @abstractmethod
+    async def update_todo_list_items(
+        self,
+        todo_id: uuid.UUID,
+        items_data: dict[uuid.UUID, TodoListItemUpdateRequest],
+        user_id: uuid.UUID,
+    ) -> list[TodoListItemModel] | None:
+        """Update multiple items in a user's todo list all or nothing, None if any item is not owned."""
+
     @abstractmethod
     async def delete_todo_list_item(
         self, todo_id: uuid.UUID, item_id: uuid.UUID, user_id: uuid.UUID,
     ) -> bool:
         """Delete a user's todo item from a todo list."""
 
+    @abstractmethod
+    async def delete_todo_list_items(
+        self, todo_id: uuid.UUID, item_ids: list[uuid.UUID], user_id: uuid.UUID,
+    ) -> list[uuid.UUID]:
+        """Delete multiple items from a user's todo list in one statement, returning the IDs that were not found."""
+
     @abstractmethod
     async def count_todo_lists(self, user_id: uuid.UUID) -> int:
         """Count all todo lists for a specific user."""
@@ -6,13 +6,17 @@ using SQLAlchemy ORM for database operations.
 
 import uuid
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, insert
 from sqlalchemy.future import select
 
 from app.config.database import DatabaseConnection
 from app.models.user_model import UserModel
 from app.repositories.user_repository_interface import UserRepositoryInterface
-from app.utils.logger_util import get_logger
+
+# Built once at import time so each call only binds its values
+_INSERT_USER = insert(UserModel).returning(UserModel)
+_SELECT_USER_BY_ID = select(UserModel).where(UserModel.id == bindparam("user_id"))
+_SELECT_USER_BY_EMAIL = select(UserModel).where(UserModel.email == bindparam("user_email"))
 
 
 class UserPGRepository(UserRepositoryInterface):
@@ -42,25 +46,10 @@ class UserPGRepository(UserRepositoryInterface):
             IntegrityError: If a user with the same email or username already exists.
 
         """
-        get_logger().debug("Creating new user with email: %s", email)
-
-        async with self.database.async_session() as session:
-            # Instantiate UserModel using keyword arguments matching its fields
-            new_user = UserModel(
-                id=uuid.uuid4(),
-                email=email,
-                username=username,
-                password=password_hash,
-            )
-            session.add(new_user)
-            try:
-                await session.commit()
-                await session.refresh(new_user)
-            except IntegrityError:
-                await session.rollback()
-                raise
-            else:
-                return new_user
+        async with self.database.autocommit_session() as session:
+            # Single INSERT ... RETURNING hands back the server generated id and timestamps
+            row = {"email": email, "username": username, "password": password_hash}
+            return (await session.scalars(_INSERT_USER, row)).one()
 
     async def get_user_by_id(self, user_id: uuid.UUID) -> UserModel | None:
         """Get user data by ID.
@@ -72,9 +61,8 @@ class UserPGRepository(UserRepositoryInterface):
             UserModel | None: The user data if found, else None.
 
         """
-        async with self.database.async_session() as session:
-            query = select(UserModel).where(UserModel.id == user_id)
-            result = await session.execute(query)
+        async with self.database.autocommit_session() as session:
+            result = await session.execute(_SELECT_USER_BY_ID, {"user_id": user_id})
             return result.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> UserModel | None:
@@ -87,7 +75,6 @@ class UserPGRepository(UserRepositoryInterface):
             UserModel | None: The user data if found, else None.
 
         """
-        async with self.database.async_session() as session:
-            query = select(UserModel).where(UserModel.email == email)
-            result = await session.execute(query)
+        async with self.database.autocommit_session() as session:
+            result = await session.execute(_SELECT_USER_BY_EMAIL, {"user_email": email})
             return result.scalar_one_or_none()
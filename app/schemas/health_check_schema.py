@@ -1,13 +1,11 @@
 """Pydantic schemas for request/response serialization."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class HealthCheckResponse(BaseModel):
     """Schema for health check response."""
 
-    status: str
-    class Config:
-        """Configuration for Pydantic model."""
+    model_config = ConfigDict(from_attributes=True)
 
-        from_attributes = True
+    status: str
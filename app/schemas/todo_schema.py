@@ -1,44 +1,39 @@
 """Todo schema definitions for FastAPI application."""
 
 from datetime import datetime
-from typing import ClassVar
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+
+
+def _uuid_to_str(v: object) -> object:
+    """Convert a UUID to its string form, leaving anything else for the str validation."""
+    return str(v) if type(v) is UUID else v
+
+
+# Request ids, accepted as UUIDs or strings and handed to the services as strings
+type UUIDStr = Annotated[str, BeforeValidator(_uuid_to_str)]
 
 
 class BaseEntitySchema(BaseModel):
     """Base schema for entities with common fields.
 
     Args:
-        id (int): Unique identifier of the entity.
+        id (UUID): Unique identifier of the entity.
         created_at (datetime): Timestamp when the entity was created.
         updated_at (datetime): Timestamp when the entity was last updated.
 
     """
 
-    id: str
+    # datetimes and UUIDs are encoded as ISO 8601 and hyphenated strings by pydantic-core itself, without
+    # a Python json_encoders or validator callback
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_uuid_to_string(cls, v: str | UUID) -> str:
-        """Convert UUID to string if needed."""
-        if isinstance(v, UUID):
-            return str(v)
-        if isinstance(v, str):
-            return v
-        msg = f"Invalid type for id: {type(v)}. Expected UUID or str."
-        raise TypeError(msg)
-
-
-    class Config:
-        """Pydantic model configuration."""
-
-        from_attributes = True
-        json_encoders: ClassVar[dict] = {datetime: lambda v: v.isoformat()}
-
 
 class TodoListCreateRequest(BaseModel):
     """Schema for creating a new todo list.
@@ -122,8 +117,10 @@ class PaginatedTodoListResponse(BaseModel):
 
     data: list[TodoListResponse]
     size: int
-    current_page: int
+    # None when the page was read after a cursor rather than by page number
+    current_page: int | None
     total_pages: int
+    next_cursor: str | None = None
 
 
 class PaginatedTodoListItemResponse(BaseModel):
@@ -131,8 +128,10 @@ class PaginatedTodoListItemResponse(BaseModel):
 
     data: list[TodoListItemResponse]
     size: int
-    current_page: int
+    # None when the page was read after a cursor rather than by page number
+    current_page: int | None
     total_pages: int
+    next_cursor: str | None = None
 
 
 class TodoListCreateManyRequest(BaseModel):
@@ -155,19 +154,9 @@ class TodoListUpdateItem(BaseModel):
 
     """
 
-    id: str
+    id: UUIDStr
     data: TodoListUpdateRequest
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_uuid_to_string(cls, v: str | UUID) -> str:
-        """Convert UUID to string if needed."""
-        if isinstance(v, UUID):
-            return str(v)
-        if isinstance(v, str):
-            return v
-        msg = f"Invalid type for id: {type(v)}. Expected UUID or str."
-        raise TypeError(msg)
 
 class TodoListUpdateManyRequest(BaseModel):
     """Schema for updating multiple todo lists.
@@ -188,13 +177,7 @@ class TodoListDeleteManyRequest(BaseModel):
 
     """
 
-    todo_ids: list[str]
-
-    @field_validator("todo_ids", mode="before", check_fields=False)
-    @classmethod
-    def convert_uuid_to_string(cls, v: list[UUID | str]) -> list[str]:
-        """Convert UUIDs to strings if needed."""
-        return [str(item) for item in v]
+    todo_ids: list[UUIDStr]
 
 
 class TodoListItemCreateManyRequest(BaseModel):
@@ -217,20 +200,9 @@ class TodoListItemUpdateItem(BaseModel):
 
     """
 
-    id: str
+    id: UUIDStr
     data: TodoListItemUpdateRequest
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_uuid_to_string(cls, v: str | UUID) -> str:
-        """Convert UUID to string if needed."""
-        if isinstance(v, UUID):
-            return str(v)
-        if isinstance(v, str):
-            return v
-        msg = f"Invalid type for id: {type(v)}. Expected UUID or str."
-        raise TypeError(msg)
-
 
 class TodoListItemUpdateManyRequest(BaseModel):
     """Schema for updating multiple todo list items.
@@ -251,13 +223,7 @@ class TodoListItemDeleteManyRequest(BaseModel):
 
     """
 
-    item_ids: list[str]
-
-    @field_validator("item_ids", mode="before", check_fields=False)
-    @classmethod
-    def convert_uuid_to_string(cls, v: list[UUID | str]) -> list[str]:
-        """Convert UUIDs to strings if needed."""
-        return [str(item) for item in v]
+    item_ids: list[UUIDStr]
 
 
 class SuccessResponse(BaseModel):
@@ -1,9 +1,8 @@
 """User schema definitions for FastAPI application."""
 from datetime import datetime
-from typing import ClassVar
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class UserCreateRequest(BaseModel):
@@ -13,15 +12,29 @@ class UserCreateRequest(BaseModel):
     username: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def canonicalize_email(cls, v: str) -> str:
+        """Lowercase the email so it is stored in one form and matched exactly by the unique email index."""
+        return v.lower()
+
 class UserLoginRequest(BaseModel):
     """Schema for user login."""
 
     email: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def canonicalize_email(cls, v: str) -> str:
+        """Lowercase the email so it is looked up in the form it was stored in."""
+        return v.lower()
+
 class UserResponse(BaseModel):
     """Schema for returning user data."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     email: str
     username: str
@@ -39,19 +52,7 @@ class UserResponse(BaseModel):
         msg = f"Invalid type for id: {type(v)}. Expected UUID or str."
         raise TypeError(msg)
 
-    class Config:
-        """Pydantic model configuration."""
-
-        from_attributes = True
-        json_encoders: ClassVar[dict] = {datetime: lambda v: v.isoformat()}
-
 class UserResponseWithToken(UserResponse):
     """Schema for returning user data with JWT token."""
 
     token: str
-
-    class Config:
-        """Pydantic model configuration."""
-
-        from_attributes = True
-        json_encoders: ClassVar[dict] = {datetime: lambda v: v.isoformat()}
@@ -5,6 +5,9 @@ with user authorization.
 """
 
 import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import RowMapping
 
 from app.exceptions.todo_exception import TodoListItemNotFoundError, TodoListNotFoundError
 from app.models.todo_model import TodoListItemModel, TodoListModel
@@ -16,6 +19,7 @@ from app.schemas.todo_schema import (
     TodoListItemUpdateRequest,
     TodoListUpdateRequest,
 )
+from app.utils.cursor_util import PageCursor
 
 
 class TodoService:
@@ -79,19 +83,22 @@ class TodoService:
         user_id: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[TodoListModel]:
+        after: PageCursor | None = None,
+    ) -> Sequence[RowMapping]:
         """Get all todo lists for a user with pagination (without their own list items).
 
         Args:
             user_id (str): ID of the user whose todo lists to retrieve.
             skip (int, optional): Number of records to skip for pagination. Defaults to 0.
             limit (int, optional): Maximum number of records to return. Defaults to 100.
+            after (PageCursor | None, optional): Cursor of the previous page's last row, replacing skip.
+                Defaults to None.
 
         Returns:
-            list[TodoListModel]: List of TodoListModel instances with pagination applied.
+            Sequence[RowMapping]: Rows with the columns of each todo list, with pagination applied.
 
         """
-        return await self.todo_repository.get_all_todo_lists(uuid.UUID(user_id), skip, limit)
+        return await self.todo_repository.get_todo_list_summaries(uuid.UUID(user_id), skip, limit, after)
 
     async def update_todo_list(
         self,
@@ -168,6 +175,7 @@ class TodoService:
         user_id: str,
         skip: int = 0,
         limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[TodoListItemModel]:
         """Get all items for a user's todo list with pagination.
 
@@ -176,6 +184,8 @@ class TodoService:
             user_id (str): ID of the user requesting the items.
             skip (int, optional): Number of records to skip for pagination. Defaults to 0.
             limit (int, optional): Maximum number of records to return. Defaults to 100.
+            after (PageCursor | None, optional): Cursor of the previous page's last item, replacing skip.
+                Defaults to None.
 
         Returns:
             list[TodoListItemModel]: List of TodoListItemModel instances with pagination applied.
@@ -185,7 +195,9 @@ class TodoService:
             UserNotAuthorizedError: If the user is not authorized to access this todo list.
 
         """
-        return await self.todo_repository.get_todo_list_items(uuid.UUID(todo_id), uuid.UUID(user_id), skip, limit)
+        return await self.todo_repository.get_todo_list_items(
+            uuid.UUID(todo_id), uuid.UUID(user_id), skip, limit, after,
+        )
 
     async def update_todo_item(
         self,
@@ -257,11 +269,7 @@ class TodoService:
             list[TodoListModel]: List of created todo lists.
 
         """
-        created_todos = []
-        for todo_data in todo_lists:
-            created_todo = await self.todo_repository.create_todo_list(todo_data, uuid.UUID(user_id))
-            created_todos.append(created_todo)
-        return created_todos
+        return await self.todo_repository.create_todo_lists(todo_lists, uuid.UUID(user_id))
 
     async def update_many_todo_lists(self, updates: list, user_id: str) -> list[TodoListModel]:
         """Update multiple todo lists for a user.
@@ -278,14 +286,10 @@ class TodoService:
             UserNotAuthorizedError: If the user is not authorized to update any of the todo lists.
 
         """
-        updated_todos = []
-        for update in updates:
-            todo_id = uuid.UUID(update.id)
-            todo_data = update.data
-            updated_todo = await self.todo_repository.update_todo_list(todo_id, todo_data, uuid.UUID(user_id))
-            if not updated_todo:
-                raise TodoListNotFoundError(todo_id)
-            updated_todos.append(updated_todo)
+        todo_data = {uuid.UUID(update.id): update.data for update in updates}
+        updated_todos = await self.todo_repository.update_todo_lists(todo_data, uuid.UUID(user_id))
+        if updated_todos is None:
+            raise TodoListNotFoundError(next(iter(todo_data)))
         return updated_todos
 
     async def delete_many_todo_lists(self, todo_ids: list[str], user_id: str) -> None:
@@ -300,10 +304,12 @@ class TodoService:
             UserNotAuthorizedError: If the user is not authorized to delete any of the todo lists.
 
         """
-        for todo_id in todo_ids:
-            success = await self.todo_repository.delete_todo_list(uuid.UUID(todo_id), uuid.UUID(user_id))
-            if not success:
-                raise TodoListNotFoundError(uuid.UUID(todo_id))
+        missing_ids = await self.todo_repository.delete_todo_lists(
+            [uuid.UUID(todo_id) for todo_id in todo_ids],
+            uuid.UUID(user_id),
+        )
+        if missing_ids:
+            raise TodoListNotFoundError(missing_ids[0])
 
     async def create_many_todo_list_items(
         self,
@@ -326,12 +332,9 @@ class TodoService:
             UserNotAuthorizedError: If the user is not authorized to add items to this todo list.
 
         """
-        created_items = []
-        for item_data in items:
-            item = await self.todo_repository.add_todo_list_item(uuid.UUID(todo_id), item_data, uuid.UUID(user_id))
-            if not item:
-                raise TodoListNotFoundError(uuid.UUID(todo_id))
-            created_items.append(item)
+        created_items = await self.todo_repository.add_todo_list_items(uuid.UUID(todo_id), items, uuid.UUID(user_id))
+        if created_items is None:
+            raise TodoListNotFoundError(uuid.UUID(todo_id))
         return created_items
 
     async def update_many_todo_list_items(
@@ -355,18 +358,14 @@ class TodoService:
             UserNotAuthorizedError: If the user is not authorized to update items in this todo list.
 
         """
-        updated_items = []
-        for update in updates:
-            update_id = uuid.UUID(str(update.id))
-            item = await self.todo_repository.update_todo_list_item(
-                uuid.UUID(todo_id),
-                update_id,
-                update.data,
-                uuid.UUID(user_id),
-            )
-            if not item:
-                raise TodoListNotFoundError(uuid.UUID(todo_id))
-            updated_items.append(item)
+        items_data = {uuid.UUID(str(update.id)): update.data for update in updates}
+        updated_items = await self.todo_repository.update_todo_list_items(
+            uuid.UUID(todo_id),
+            items_data,
+            uuid.UUID(user_id),
+        )
+        if updated_items is None:
+            raise TodoListNotFoundError(uuid.UUID(todo_id))
         return updated_items
 
     async def delete_many_todo_list_items(
@@ -387,14 +386,13 @@ class TodoService:
             UserNotAuthorizedError: If the user is not authorized to delete items from this todo list.
 
         """
-        for item_id in item_ids:
-            success = await self.todo_repository.delete_todo_list_item(
-                uuid.UUID(todo_id),
-                uuid.UUID(item_id),
-                uuid.UUID(user_id),
-            )
-            if not success:
-                raise TodoListItemNotFoundError(uuid.UUID(todo_id), uuid.UUID(item_id))
+        missing_ids = await self.todo_repository.delete_todo_list_items(
+            uuid.UUID(todo_id),
+            [uuid.UUID(item_id) for item_id in item_ids],
+            uuid.UUID(user_id),
+        )
+        if missing_ids:
+            raise TodoListItemNotFoundError(uuid.UUID(todo_id), missing_ids[0])
 
     async def count_todo_lists(self, user_id: str) -> int:
         """Count all todo lists for a specific user.
@@ -0,0 +1,53 @@
+"""Pagination cursor utility functions for the App.
+
+A cursor points at the last row of a page by its `(created_at, id)` sort key, so the next page can be read
+with an index seek instead of skipping rows with OFFSET. It is handed to clients as an opaque string.
+"""
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+type PageCursor = tuple[datetime, uuid.UUID]
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode the sort key of a row into an opaque URL safe cursor.
+
+    Args:
+        created_at: The creation timestamp of the last row of the page
+        row_id: The ID of the last row of the page
+
+    Returns:
+        The cursor string
+
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> PageCursor:
+    """Decode a cursor created by `encode_cursor` back into its sort key.
+
+    Args:
+        cursor: The cursor string
+
+    Returns:
+        The creation timestamp and ID of the row the cursor points at
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        msg = f"Invalid cursor: {cursor}"
+        raise ValueError(msg) from e
+    created_at, _, row_id = raw.partition("|")
+    try:
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except ValueError as e:
+        msg = f"Invalid cursor: {cursor}"
+        raise ValueError(msg) from e
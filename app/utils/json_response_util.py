@@ -0,0 +1,86 @@
+"""JSON response utilities for the FastAPI controllers.
+
+Controllers build one serializer per response schema at import time and return the encoded bytes directly,
+so FastAPI does not re-validate and re-encode the returned model on every request.
+"""
+from collections.abc import Callable, Iterable
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_serializer[T](schema: type[T]) -> Callable[[T], bytes]:
+    """Build a reusable JSON serializer for a response schema.
+
+    Args:
+        schema (type[T]): The response schema the serializer is built for.
+
+    Returns:
+        Callable[[T], bytes]: A function encoding schema instances to JSON bytes using pydantic-core.
+
+    """
+    return TypeAdapter(schema).dump_json
+
+
+def json_response(content: bytes, status_code: int = 200) -> Response:
+    """Wrap already encoded JSON bytes in a response.
+
+    Args:
+        content (bytes): The encoded JSON body.
+        status_code (int, optional): The HTTP status code. Defaults to 200.
+
+    Returns:
+        Response: The response carrying the JSON body.
+
+    """
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def json_list_serializer[T](schema: type[T]) -> Callable[[Iterable[object]], bytes]:
+    """Build a reusable JSON serializer encoding a list of rows as a list of a response schema.
+
+    The rows are validated against the schema in one pydantic-core call, reading their attributes or keys directly,
+    instead of building and encoding one schema instance per row from Python.
+
+    Args:
+        schema (type[T]): The response schema each row is encoded as.
+
+    Returns:
+        Callable[[Iterable[object]], bytes]: A function encoding ORM objects or row mappings to a JSON array.
+
+    """
+    adapter = TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+    def serialize(rows: Iterable[object]) -> bytes:
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    return serialize
+
+
+def json_page_response(
+    data: bytes,
+    size: int,
+    current_page: int | None,
+    total_pages: int,
+    *,
+    next_cursor: str | None = None,
+) -> Response:
+    """Wrap an already encoded page of rows in the paginated envelope.
+
+    Args:
+        data (bytes): The rows of the current page, encoded as a JSON array.
+        size (int): The number of rows in the current page.
+        current_page (int | None): The current page number, or None for a page read after a cursor.
+        total_pages (int): The total number of pages.
+        next_cursor (str | None, optional): The cursor of the next page, if there may be one. Defaults to None.
+
+    Returns:
+        Response: The response carrying the `data`, `size`, `current_page`, `total_pages` and `next_cursor` fields.
+
+    """
+    buffer = bytearray(b'{"data":')
+    buffer += data
+    page = "null" if current_page is None else current_page
+    buffer += f',"size":{size},"current_page":{page},"total_pages":{total_pages},"next_cursor":'.encode()
+    buffer += b"null}" if next_cursor is None else f'"{next_cursor}"}}'.encode()
+    return json_response(bytes(buffer))
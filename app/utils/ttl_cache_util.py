@@ -0,0 +1,67 @@
+"""In-memory cache utility for the App.
+
+Entries expire a fixed number of seconds after they are set. The cache is local to the process, so with several
+server workers a write in one of them only invalidates that worker's entries and the others catch up on expiry.
+"""
+
+import time
+
+
+class TTLCache[K, V]:
+    """Bounded mapping whose entries expire after a fixed time to live."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int): The number of entries kept. Setting a new key beyond this evicts the oldest one.
+            ttl (float): Seconds an entry is served after being set. 0 disables caching.
+
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        """Get the value cached for a key.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            V | None: The cached value, or None if the key is missing or expired.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value for a key.
+
+        Args:
+            key (K): The key to cache the value under.
+            value (V): The value to cache.
+
+        """
+        if self.ttl <= 0:
+            return
+        # Re-inserting moves the key to the end, keeping the dict ordered from oldest to newest
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: K) -> None:
+        """Invalidate the value cached for a key, if any.
+
+        Args:
+            key (K): The key to invalidate.
+
+        """
+        self._entries.pop(key, None)
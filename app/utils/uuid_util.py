@@ -0,0 +1,23 @@
+"""UUID utility functions for the App.
+
+Primary keys are UUIDv7: their first 48 bits are the creation time in milliseconds, so new rows are appended
+to the right edge of the primary key index instead of landing on a random page of it.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time ordered UUID, the same way the database's uuid_generate_v7() default does.
+
+    Returns:
+        uuid.UUID: A version 7 UUID for the current time.
+
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    # Set the version nibble to 7 and the variant bits to RFC 4122
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
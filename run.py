@@ -11,4 +11,8 @@ if __name__ == "__main__":
         port=get_env_settings().server_port,
         reload=get_env_settings().server_reload,
         log_level=get_env_settings().server_log_level,
+        workers=get_env_settings().server_workers,
+        # "auto" picks uvloop/httptools when installed and falls back to asyncio/h11 otherwise (e.g. on Windows)
+        loop="auto",
+        http="auto",
     )
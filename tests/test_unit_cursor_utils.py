@@ -0,0 +1,32 @@
+"""Unit tests for pagination cursor utility functions."""
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app.utils.cursor_util import decode_cursor, encode_cursor
+
+
+class TestCursorUtils:
+    """Unit tests for pagination cursor utility functions."""
+
+    def test_encode_decode_round_trip(self) -> None:
+        """Test that a decoded cursor gives back the encoded sort key."""
+        created_at = datetime(2025, 7, 1, 12, 30, 45, 123456, tzinfo=UTC)
+        row_id = uuid.uuid4()
+
+        result = decode_cursor(encode_cursor(created_at, row_id))
+
+        assert result == (created_at, row_id)
+
+    def test_encoded_cursor_is_url_safe(self) -> None:
+        """Test that the cursor can be used in a query string as is."""
+        cursor = encode_cursor(datetime.now(UTC), uuid.uuid4())
+
+        assert cursor.replace("-", "").replace("_", "").isalnum()
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "bm90LWEtZGF0ZXx4", "%%%"])
+    def test_decode_invalid_cursor_should_raise_error(self, cursor: str) -> None:
+        """Test that decode_cursor raises ValueError for malformed cursors."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
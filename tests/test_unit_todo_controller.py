@@ -0,0 +1,75 @@
+"""Unit tests for the todo controller.
+
+This module contains unit tests for the paginated todo endpoints, calling them
+directly with a stubbed TodoService.
+"""
+
+import json
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.interfaces.api.v1.controllers.todo_controller import get_todo_list_items, get_todo_lists
+from app.services.todo_service import TodoService
+from app.utils.cursor_util import encode_cursor
+
+
+class TestTodoController:
+    """Test suite for the paginated todo endpoints."""
+
+    @pytest.fixture
+    def todo_service(self) -> AsyncMock:
+        """Create a todo service stub returning empty pages."""
+        service = AsyncMock(spec=TodoService)
+        service.get_all_todo_lists_without_items.return_value = []
+        service.count_todo_lists.return_value = 0
+        service.get_todo_list_items.return_value = []
+        service.count_todo_list_items.return_value = 0
+        return service
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [0, 20])
+    async def test_get_todo_lists_empty_page(self, todo_service: AsyncMock, size: int) -> None:
+        """Test an empty page of todo lists is returned without a next cursor."""
+        response = await get_todo_lists(todo_service, str(uuid.uuid4()), page=1, size=size)
+
+        body = json.loads(bytes(response.body))
+        assert response.status_code == 200
+        assert body["data"] == []
+        assert body["size"] == 0
+        assert body["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [0, 20])
+    async def test_get_todo_list_items_empty_page(self, todo_service: AsyncMock, size: int) -> None:
+        """Test an empty page of todo items is returned without a next cursor."""
+        response = await get_todo_list_items(todo_service, str(uuid.uuid4()), str(uuid.uuid4()), page=1, size=size)
+
+        body = json.loads(bytes(response.body))
+        assert response.status_code == 200
+        assert body["data"] == []
+        assert body["size"] == 0
+        assert body["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_todo_lists_after_cursor_has_no_current_page(self, todo_service: AsyncMock) -> None:
+        """Test a page read after a cursor does not report a page number."""
+        after = encode_cursor(datetime.now(tz=UTC), uuid.uuid4())
+
+        response = await get_todo_lists(todo_service, str(uuid.uuid4()), page=1, size=20, after=after)
+
+        assert json.loads(bytes(response.body))["current_page"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_todo_list_items_after_cursor_with_page_is_rejected(self, todo_service: AsyncMock) -> None:
+        """Test a cursor cannot be combined with a page number other than 1."""
+        after = encode_cursor(datetime.now(tz=UTC), uuid.uuid4())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_todo_list_items(todo_service, str(uuid.uuid4()), str(uuid.uuid4()), page=2, size=20, after=after)
+
+        assert exc_info.value.status_code == 400
+        todo_service.get_todo_list_items.assert_not_called()
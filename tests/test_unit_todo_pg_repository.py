@@ -3,3 +3,236 @@
 This module contains unit tests for the TodoPGRepository class, testing its
 interactions with the PostgreSQL database.
 """
+
+import uuid
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.sql import text
+
+from app.models.todo_model import TodoListModel
+from app.repositories.todo_pg_repository_impl import TodoPGRepository
+from app.repositories.user_pg_repository_impl import UserPGRepository
+from app.schemas.todo_schema import TodoListCreateRequest, TodoListItemsAddRequest, TodoListUpdateRequest
+from tests.util_db_test_connection import get_test_db_connection
+
+
+class TestTodoRepository:
+    """Test suite for TodoPGRepository."""
+
+    @pytest.fixture
+    def todo_repo(self) -> TodoPGRepository:
+        """Create a fresh test repository instance for each test."""
+        return TodoPGRepository(get_test_db_connection())
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def cleanup_user_table(self, todo_repo: TodoPGRepository) -> AsyncGenerator[None, None]:
+        """Automatically clear the user table, and with it the todo tables, after each test."""
+        yield
+
+        async with todo_repo.database.async_session() as session:
+            await session.execute(text("DELETE FROM users"))
+            await session.commit()
+
+    @pytest_asyncio.fixture
+    async def todo_list(self, todo_repo: TodoPGRepository) -> TodoListModel:
+        """Create a user owning a todo list with three items."""
+        user = await UserPGRepository(todo_repo.database).create_user("todo@example.com", "todo", "hash")
+        assert user is not None
+        todo_list = await todo_repo.create_todo_list(TodoListCreateRequest(title="Groceries"), user.id)
+        items = [TodoListItemsAddRequest(title=f"Item {i}") for i in range(3)]
+        await todo_repo.add_todo_list_items(todo_list.id, items, user.id)
+        return todo_list
+
+    @pytest.fixture
+    def statements(self, todo_repo: TodoPGRepository) -> Generator[list[str], None, None]:
+        """Record the SQL statements sent to the database while the test runs."""
+        executed: list[str] = []
+
+        def record(*args: Any) -> None:  # noqa: ANN401
+            executed.append(args[2])
+
+        engine = todo_repo.database.engine.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(engine, "before_cursor_execute", record)
+
+    @pytest.mark.asyncio
+    async def test_get_todo_list_by_id_loads_items_without_n_plus_one(
+        self,
+        todo_repo: TodoPGRepository,
+        todo_list: TodoListModel,
+        statements: list[str],
+    ) -> None:
+        """Test the todo list and its items are read with two statements."""
+        result = await todo_repo.get_todo_list_by_id(todo_list.id, todo_list.user_id)
+
+        assert result is not None
+        assert len(result.todo_items) == 3
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_all_todo_lists_loads_items_without_n_plus_one(
+        self,
+        todo_repo: TodoPGRepository,
+        todo_list: TodoListModel,
+        statements: list[str],
+    ) -> None:
+        """Test a page of todo lists and all of their items are read with two statements."""
+        result = await todo_repo.get_all_todo_lists(todo_list.user_id)
+
+        assert [todo.id for todo in result] == [todo_list.id]
+        assert len(result[0].todo_items) == 3
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_update_todo_list_without_fields_loads_items_without_n_plus_one(
+        self,
+        todo_repo: TodoPGRepository,
+        todo_list: TodoListModel,
+        statements: list[str],
+    ) -> None:
+        """Test an empty update returns the existing todo list with two statements."""
+        result = await todo_repo.update_todo_list(todo_list.id, TodoListUpdateRequest(), todo_list.user_id)
+
+        assert result is not None
+        assert len(result.todo_items) == 3
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_add_todo_list_items_inserts_in_one_statement(
+        self,
+        todo_repo: TodoPGRepository,
+        todo_list: TodoListModel,
+        statements: list[str],
+    ) -> None:
+        """Test bulk item creation sends all rows in a single INSERT ... RETURNING."""
+        items = [TodoListItemsAddRequest(title=f"Bulk {i}", description="bulk") for i in range(50)]
+
+        result = await todo_repo.add_todo_list_items(todo_list.id, items, todo_list.user_id)
+
+        assert result is not None
+        assert [item.title for item in result] == [item.title for item in items]
+        assert all(isinstance(item.id, uuid.UUID) for item in result)
+        assert sum(statement.startswith("INSERT") for statement in statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_add_todo_list_items_large_batch_is_copied(
+        self,
+        todo_repo: TodoPGRepository,
+        todo_list: TodoListModel,
+        statements: list[str],
+    ) -> None:
+        """Test a large batch is written with COPY and returned as stored."""
+        items = [TodoListItemsAddRequest(title=f"Copied {i}") for i in range(200)]
+
+        result = await todo_repo.add_todo_list_items(todo_list.id, items, todo_list.user_id)
+
+        assert result is not None
+        assert not any(statement.startswith("INSERT") for statement in statements)
+        stored = await todo_repo.get_todo_list_items(todo_list.id, todo_list.user_id, limit=1000)
+        stored_by_id = {item.id: item for item in stored}
+        assert len(stored) == 203
+        for item in result:
+            assert stored_by_id[item.id].title == item.title
+            assert stored_by_id[item.id].completed is False
+            assert stored_by_id[item.id].created_at == item.created_at
+
+    @pytest.mark.asyncio
+    async def test_add_todo_list_items_not_owned(self, todo_repo: TodoPGRepository, todo_list: TodoListModel) -> None:
+        """Test bulk item creation inserts nothing for a todo list owned by another user."""
+        result = await todo_repo.add_todo_list_items(todo_list.id, [TodoListItemsAddRequest(title="x")], uuid.uuid4())
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_create_todo_lists_inserts_in_one_statement(
+        self,
+        todo_repo: TodoPGRepository,
+        todo_list: TodoListModel,
+        statements: list[str],
+    ) -> None:
+        """Test bulk todo list creation sends all rows in a single INSERT ... RETURNING."""
+        todo_data = [TodoListCreateRequest(title=f"List {i}") for i in range(10)]
+
+        result = await todo_repo.create_todo_lists(todo_data, todo_list.user_id)
+
+        assert sorted(todo.title for todo in result) == sorted(data.title for data in todo_data)
+        assert all(todo.todo_items == [] for todo in result)
+        assert sum(statement.startswith("INSERT") for statement in statements) == 1
+        assert await todo_repo.count_todo_lists(todo_list.user_id) == 11
+
+    @pytest.mark.asyncio
+    async def test_update_todo_lists_is_all_or_nothing(
+        self, todo_repo: TodoPGRepository, todo_list: TodoListModel,
+    ) -> None:
+        """Test bulk todo list updates apply to every list or, if one is not owned, to none."""
+        other = await todo_repo.create_todo_list(TodoListCreateRequest(title="Other"), todo_list.user_id)
+
+        missing = await todo_repo.update_todo_lists(
+            {todo_list.id: TodoListUpdateRequest(title="Renamed"), uuid.uuid4(): TodoListUpdateRequest(title="x")},
+            todo_list.user_id,
+        )
+        result = await todo_repo.update_todo_lists(
+            {todo_list.id: TodoListUpdateRequest(title="Renamed"), other.id: TodoListUpdateRequest(description="d")},
+            todo_list.user_id,
+        )
+
+        assert missing is None
+        assert result is not None
+        by_id = {todo.id: todo for todo in result}
+        assert by_id[todo_list.id].title == "Renamed"
+        assert len(by_id[todo_list.id].todo_items) == 3
+        assert by_id[other.id].title == "Other"
+        assert by_id[other.id].description == "d"
+
+    @pytest.mark.asyncio
+    async def test_unloaded_relationships_raise(self, todo_repo: TodoPGRepository, todo_list: TodoListModel) -> None:
+        """Test relationships that were not eagerly loaded raise instead of lazy loading."""
+        result = await todo_repo.get_todo_list_by_id(todo_list.id, todo_list.user_id)
+        items = await todo_repo.get_todo_list_items(todo_list.id, todo_list.user_id)
+
+        assert result is not None
+        with pytest.raises(InvalidRequestError):
+            _ = result.user
+        with pytest.raises(InvalidRequestError):
+            _ = items[0].todo
+
+    @pytest.mark.asyncio
+    async def test_count_todo_list_items_is_cached_until_a_write(
+        self,
+        todo_repo: TodoPGRepository,
+        todo_list: TodoListModel,
+        statements: list[str],
+    ) -> None:
+        """Test repeated counts are served from memory and writes invalidate them."""
+        assert await todo_repo.count_todo_list_items(todo_list.id, todo_list.user_id) == 3
+        assert await todo_repo.count_todo_list_items(todo_list.id, todo_list.user_id) == 3
+        assert len(statements) == 1
+
+        await todo_repo.add_todo_list_item(todo_list.id, TodoListItemsAddRequest(title="New"), todo_list.user_id)
+
+        assert await todo_repo.count_todo_list_items(todo_list.id, todo_list.user_id) == 4
+
+    @pytest.mark.asyncio
+    async def test_count_todo_lists_is_invalidated_by_delete(
+        self, todo_repo: TodoPGRepository, todo_list: TodoListModel,
+    ) -> None:
+        """Test deleting a todo list invalidates the cached counts."""
+        assert await todo_repo.count_todo_lists(todo_list.user_id) == 1
+
+        await todo_repo.delete_todo_list(todo_list.id, todo_list.user_id)
+
+        assert await todo_repo.count_todo_lists(todo_list.user_id) == 0
+        assert await todo_repo.count_todo_list_items(todo_list.id, todo_list.user_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_todo_list_by_id_not_found(self, todo_repo: TodoPGRepository) -> None:
+        """Test todo list retrieval when the todo list doesn't exist."""
+        result = await todo_repo.get_todo_list_by_id(uuid.uuid4(), uuid.uuid4())
+
+        assert result is None
@@ -0,0 +1,59 @@
+"""Unit tests for the in-memory TTL cache utility."""
+from unittest.mock import patch
+
+from app.utils.ttl_cache_util import TTLCache
+
+
+class TestTTLCache:
+    """Unit tests for the in-memory TTL cache utility."""
+
+    def test_get_returns_cached_value(self) -> None:
+        """Test that a value is served until it expires."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+
+        cache.set("key", 1)
+
+        assert cache.get("key") == 1
+        assert cache.get("missing") is None
+
+    def test_get_expired_value_returns_none(self) -> None:
+        """Test that a value is dropped once its time to live has passed."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+        with patch("app.utils.ttl_cache_util.time.monotonic", return_value=100.0):
+            cache.set("key", 1)
+
+        with patch("app.utils.ttl_cache_util.time.monotonic", return_value=129.0):
+            assert cache.get("key") == 1
+        with patch("app.utils.ttl_cache_util.time.monotonic", return_value=130.0):
+            assert cache.get("key") is None
+
+    def test_pop_invalidates_value(self) -> None:
+        """Test that a popped key is no longer served."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+        cache.set("key", 1)
+
+        cache.pop("key")
+        cache.pop("missing")
+
+        assert cache.get("key") is None
+
+    def test_set_beyond_maxsize_evicts_oldest(self) -> None:
+        """Test that the oldest key is evicted once the cache is full."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.set("first", 3)
+
+        cache.set("third", 4)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == 3
+        assert cache.get("third") == 4
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        """Test that nothing is cached when the time to live is 0."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=0)
+
+        cache.set("key", 1)
+
+        assert cache.get("key") is None
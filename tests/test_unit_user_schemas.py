@@ -0,0 +1,21 @@
+"""Unit tests for the user request schemas."""
+from app.schemas.user_schema import UserCreateRequest, UserLoginRequest
+
+
+class TestUserSchemas:
+    """Unit tests for the user request schemas."""
+
+    def test_create_request_lowercases_email(self) -> None:
+        """Test that emails are stored in their lowercase form."""
+        request = UserCreateRequest.model_validate(
+            {"email": "Test.User@Example.COM", "username": "Test", "password": "x"},
+        )
+
+        assert request.email == "test.user@example.com"
+        assert request.username == "Test"
+
+    def test_login_request_lowercases_email(self) -> None:
+        """Test that login looks users up by the same lowercase form they were stored in."""
+        request = UserLoginRequest.model_validate({"email": "Test.User@Example.COM", "password": "x"})
+
+        assert request.email == "test.user@example.com"
@@ -0,0 +1,31 @@
+"""Unit tests for the UUID utility functions."""
+from unittest.mock import patch
+
+from app.utils.uuid_util import uuid7
+
+
+class TestUUID7:
+    """Unit tests for the UUIDv7 generator."""
+
+    def test_uuid7_sets_version_and_variant(self) -> None:
+        """Test that generated ids are RFC 4122 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_uuid7_starts_with_timestamp(self) -> None:
+        """Test that the first 48 bits hold the Unix time in milliseconds."""
+        with patch("app.utils.uuid_util.time.time_ns", return_value=1_700_000_000_123_456_789):
+            value = uuid7()
+
+        assert value.int >> 80 == 1_700_000_000_123
+
+    def test_uuid7_sorts_by_creation_time(self) -> None:
+        """Test that ids generated in later milliseconds sort after earlier ones."""
+        with patch("app.utils.uuid_util.time.time_ns", return_value=1_000_000_000):
+            earlier = uuid7()
+        with patch("app.utils.uuid_util.time.time_ns", return_value=2_000_000_000):
+            later = uuid7()
+
+        assert earlier < later